@@ -7,16 +7,26 @@
 再利用できるようにします。
 """
 
-import copy
+import atexit
+import functools
 import hashlib
 import json
 import os
 import pickle
+import struct
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 
+import numpy as np
 import pandas as pd
 
+try:  # 任意依存: zstandardがインストールされていればキャッシュを圧縮する
+    import zstandard
+except ModuleNotFoundError:  # pragma: no cover - zstandard未インストール環境
+    zstandard = None  # type: ignore
+
 from core.logger import get_logger, log_exception
 from core.paths import ensure_cache_dir, resolve_base_dir
 from core.version import APP_VERSION
@@ -24,6 +34,51 @@ from core.version import APP_VERSION
 # ロガーの初期化
 logger = get_logger("cache_manager")
 
+# pickleプロトコルとファイルI/Oのバッファサイズ（1 MiB）
+_PICKLE_PROTOCOL = pickle.HIGHEST_PROTOCOL
+_IO_BUFFER_SIZE = 1 << 20
+
+# zstdフレームのマジックバイト（圧縮キャッシュの判別用）
+_ZSTD_MAGIC = b"\x28\xb5\x2f\xfd"
+_ZSTD_LEVEL = 3
+# zstdフレームヘッダーの最大長（展開後サイズの取得に読む量）
+_ZSTD_FRAME_HEADER_MAX = 18
+
+# raw_data（HDF5）の圧縮設定（blosc+LZ4は展開が速く、読み込みを遅くしない）
+_HDF_COMPLIB = "blosc:lz4"
+_HDF_COMPLEVEL = 5
+
+# pickleのアウトオブバンドバッファを格納するファイルの配置単位（バイト）
+_BUFFER_ALIGNMENT = 64
+
+# キャッシュIDに影響する設定キー（バージョンは設定値ではなく core.version.APP_VERSION を使う）
+_CACHE_RELEVANT_KEYS = (
+    "time_column",
+    "acceleration_column_inner_capsule",
+    "acceleration_column_drag_shield",
+    "use_inner_acceleration",
+    "use_drag_acceleration",
+    "sampling_rate",
+    "gravity_constant",
+    "acceleration_threshold",
+    "end_gravity_level",
+    "min_seconds_after_start",
+    "invert_inner_acceleration",
+    "use_float32",
+    "window_size",
+)
+
+# キャッシュID用の設定サブセットのエンコーダ（呼び出しごとに生成しない）
+_encode_config = json.JSONEncoder(sort_keys=True, separators=(",", ":")).encode
+
+# キャッシュ書き込み用のバックグラウンドスレッド（書き込みは1本に直列化する）
+_writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix="cache-writer")
+atexit.register(_writer.shutdown, wait=True)
+
+# 書き込み待ちのキャッシュ（元CSVの絶対パス -> Future）
+_pending_writes = {}
+_pending_lock = threading.Lock()
+
 
 class _RestrictedUnpickler(pickle.Unpickler):
     """pickle.load の安全なラッパー。許可されたモジュールのみロードを許可する。"""
@@ -62,55 +117,222 @@ class _RestrictedUnpickler(pickle.Unpickler):
         )
 
 
-def _safe_pickle_load(f):
+def _safe_pickle_load(f, buffers=None):
     """pickle.load の安全な代替。RestrictedUnpickler を使用する。"""
-    return _RestrictedUnpickler(f).load()
+    return _RestrictedUnpickler(f, buffers=buffers).load()
+
+
+def _aligned(offset):
+    """オフセットを `_BUFFER_ALIGNMENT` の倍数に切り上げる。"""
+    return -(-offset // _BUFFER_ALIGNMENT) * _BUFFER_ALIGNMENT
 
 
-def generate_cache_id(file_path, config):
+def _write_pickle_buffers(buffers, buffer_path):
+    """
+    アウトオブバンドバッファをまとめて書き込む
+
+    形式: バッファ数(uint64) + 各バッファ長(uint64)の表 + 本体。
+    各本体の先頭は `_BUFFER_ALIGNMENT` バイト境界に揃える。
+    zstandardが利用可能ならpickle本体と同様にファイル全体をzstdで圧縮する。
+    """
+    raws = [buf.raw() for buf in buffers]
+    header = struct.pack(f"<{len(raws) + 1}Q", len(raws), *(raw.nbytes for raw in raws))
+    total = len(header)
+    for raw in raws:
+        total = _aligned(total) + raw.nbytes
+
+    with open(buffer_path, "wb", buffering=_IO_BUFFER_SIZE) as f:
+        if zstandard is None:
+            _write_buffer_blocks(f, header, raws)
+        else:
+            # 展開後のサイズをフレームに記録し、読み込み時に一度で領域を確保できるようにする
+            compressor = zstandard.ZstdCompressor(level=_ZSTD_LEVEL, threads=-1)
+            with compressor.stream_writer(f, size=total, closefd=False) as writer:
+                _write_buffer_blocks(writer, header, raws)
+
+
+def _write_buffer_blocks(f, header, raws):
+    """ヘッダーと各バッファを境界を揃えながら順に書き込む。"""
+    f.write(header)
+    offset = len(header)
+    for raw in raws:
+        padding = _aligned(offset) - offset
+        f.write(b"\0" * padding)
+        f.write(raw)
+        offset += padding + raw.nbytes
+
+
+def _read_pickle_buffers(buffer_path):
+    """`_write_pickle_buffers` で書いたファイルを読み込み、各バッファのmemoryviewを返す。"""
+    with open(buffer_path, "rb", buffering=_IO_BUFFER_SIZE) as f:
+        magic = f.read(len(_ZSTD_MAGIC))
+        f.seek(0)
+        if magic != _ZSTD_MAGIC:
+            blob = bytearray(os.fstat(f.fileno()).st_size)
+            f.readinto(blob)
+        else:
+            if zstandard is None:
+                raise pickle.UnpicklingError("zstd圧縮されたキャッシュですが、zstandardがインストールされていません")
+            content_size = zstandard.get_frame_parameters(f.read(_ZSTD_FRAME_HEADER_MAX)).content_size
+            f.seek(0)
+            blob = bytearray(content_size)
+            target = memoryview(blob)
+            filled = 0
+            with zstandard.ZstdDecompressor().stream_reader(f, closefd=False) as reader:
+                while filled < content_size:
+                    read = reader.readinto(target[filled:])
+                    if not read:
+                        raise pickle.UnpicklingError(f"キャッシュのバッファが途中で終わっています: {buffer_path}")
+                    filled += read
+    view = memoryview(blob)
+    (count,) = struct.unpack_from("<Q", blob)
+    lengths = struct.unpack_from(f"<{count}Q", blob, 8)
+    offset = 8 * (count + 1)
+    buffers = []
+    for length in lengths:
+        offset = _aligned(offset)
+        buffers.append(view[offset : offset + length])
+        offset += length
+    return buffers
+
+
+def _dump_cache_pickle(data, cache_path):
+    """
+    キャッシュをpickleで書き込む
+
+    zstandardが利用可能ならストリーム圧縮する。NumPy配列などの連続バッファは
+    pickleストリームへコピーせず、アウトオブバンドで `.buf` ファイルに書き出す
+    （`.buf` も同じくzstdで圧縮する）。
+    """
+    buffers = []
+    with open(cache_path, "wb", buffering=_IO_BUFFER_SIZE) as f:
+        if zstandard is None:
+            pickle.dump(data, f, protocol=_PICKLE_PROTOCOL, buffer_callback=buffers.append)
+        else:
+            compressor = zstandard.ZstdCompressor(level=_ZSTD_LEVEL, threads=-1)
+            with compressor.stream_writer(f, closefd=False) as writer:
+                pickle.dump(data, writer, protocol=_PICKLE_PROTOCOL, buffer_callback=buffers.append)
+
+    buffer_path = _buffers_path(cache_path)
+    if not buffers:
+        buffer_path.unlink(missing_ok=True)
+        return
+    try:
+        _write_pickle_buffers(buffers, buffer_path)
+    except Exception:
+        # バッファが欠けたpickleは読み込めないため一緒に削除する
+        Path(cache_path).unlink(missing_ok=True)
+        buffer_path.unlink(missing_ok=True)
+        raise
+
+
+def _load_cache_pickle(cache_path):
+    """キャッシュのpickleを読み込む。zstd圧縮の有無はマジックバイトで判別する。"""
+    buffer_path = _buffers_path(cache_path)
+    buffers = _read_pickle_buffers(buffer_path) if buffer_path.exists() else None
+    with open(cache_path, "rb", buffering=_IO_BUFFER_SIZE) as f:
+        is_compressed = f.read(len(_ZSTD_MAGIC)) == _ZSTD_MAGIC
+        f.seek(0)
+        if not is_compressed:
+            return _safe_pickle_load(f, buffers)
+        if zstandard is None:
+            raise pickle.UnpicklingError("zstd圧縮されたキャッシュですが、zstandardがインストールされていません")
+        with zstandard.ZstdDecompressor().stream_reader(f, closefd=False) as reader:
+            return _safe_pickle_load(reader, buffers)
+
+
+def _raw_data_path(cache_path):
+    """キャッシュに対応するraw_data（HDF5）ファイルのパスを返す。"""
+    cache_path_obj = Path(cache_path)
+    return cache_path_obj.with_name(cache_path_obj.stem + "_raw.h5")
+
+
+def _buffers_path(cache_path):
+    """キャッシュに対応するpickleアウトオブバンドバッファのファイルパスを返す。"""
+    return Path(cache_path).with_suffix(".buf")
+
+
+def _downcast_raw_data(raw_data):
+    """
+    raw_dataの数値列を値が変わらない範囲で小さいデータ型に変換する
+
+    整数列は値域に合わせて縮小し、浮動小数点列はfloat32で全要素が
+    同じ値を表現できる場合のみfloat32に変換します。
+
+    Args:
+        raw_data (pandas.DataFrame): 元のCSVデータ
+
+    Returns:
+        pandas.DataFrame: 型を縮小したデータ（変換不要な場合は元のオブジェクト）
+    """
+    dtypes = {}
+    for column in raw_data.columns:
+        series = raw_data[column]
+        if pd.api.types.is_integer_dtype(series.dtype):
+            downcast_dtype = pd.to_numeric(series, downcast="integer").dtype
+            if downcast_dtype != series.dtype:
+                dtypes[column] = downcast_dtype
+        elif series.dtype == np.float64:
+            values = series.to_numpy()
+            if np.array_equal(values.astype(np.float32), values, equal_nan=True):
+                dtypes[column] = np.float32
+
+    return raw_data.astype(dtypes) if dtypes else raw_data
+
+
+@functools.lru_cache(maxsize=4096)
+def _compute_cache_id(file_path, file_mtime, file_size, app_version, config_items):
+    """ファイルパス・最終更新時間・サイズ・アプリバージョン・設定サブセットからキャッシュIDを計算する（結果はメモ化）。"""
+    # ファイルパス、最終更新時間、サイズ、アプリバージョン、設定情報を結合
+    config_subset = dict(config_items)
+    cache_data = f"{file_path}:{file_mtime}:{file_size}:{app_version}:{_encode_config(config_subset)}"
+
+    # BLAKE2b（128bit）ハッシュを計算（暗号強度は不要なため高速なハッシュを使用）
+    return hashlib.blake2b(cache_data.encode(), digest_size=16).hexdigest()
+
+
+def generate_cache_id(file_path, config, file_stat=None):
     """
     CSVファイルと設定に基づいてキャッシュIDを生成する
 
+    IDにはファイルの最終更新時間・サイズとアプリケーションバージョンも含まれるため、
+    同じIDのキャッシュファイルが存在すればそのキャッシュは有効とみなせる。
+
     Args:
         file_path (str): 元のCSVファイルのパス
         config (dict): 現在の設定情報
+        file_stat (os.stat_result, optional): 取得済みの `os.stat(file_path)` の結果。
+            `save_to_cache` にも同じ値を渡すとstatの呼び出しが1回で済む
 
     Returns:
         str: 一意のキャッシュID
     """
-    # ファイルの最終更新時間を取得
-    file_mtime = os.path.getmtime(file_path)
-
-    # キャッシュIDに影響する設定キーを抽出
-    cache_relevant_keys = [
-        "time_column",
-        "acceleration_column_inner_capsule",
-        "acceleration_column_drag_shield",
-        "use_inner_acceleration",
-        "use_drag_acceleration",
-        "sampling_rate",
-        "gravity_constant",
-        "acceleration_threshold",
-        "end_gravity_level",
-        "min_seconds_after_start",
-        "invert_inner_acceleration",
-        "window_size",
-        "app_version",
-    ]
-
-    # 設定情報のサブセットを作成
-    config_subset = {key: config.get(key) for key in cache_relevant_keys}
-
-    # ファイルパス、最終更新時間、設定情報を結合
-    cache_data = f"{file_path}:{file_mtime}:{json.dumps(config_subset, sort_keys=True)}"
-
-    # SHA-256ハッシュを計算
-    cache_id = hashlib.sha256(cache_data.encode()).hexdigest()
-
-    logger.debug(f"ファイル {os.path.basename(file_path)} のキャッシュID: {cache_id}")
+    # ファイルの最終更新時間とサイズを取得
+    if file_stat is None:
+        file_stat = os.stat(file_path)
+    file_mtime = file_stat.st_mtime
+    file_size = file_stat.st_size
+
+    # 設定情報のサブセットを（ハッシュ可能な）タプルとして作成
+    config_items = tuple((key, config.get(key)) for key in _CACHE_RELEVANT_KEYS)
+
+    try:
+        cache_id = _compute_cache_id(file_path, file_mtime, file_size, APP_VERSION, config_items)
+    except TypeError:
+        # 設定値にハッシュ不可能な値が含まれる場合はメモ化せずに計算
+        cache_id = _compute_cache_id.__wrapped__(file_path, file_mtime, file_size, APP_VERSION, config_items)
+
+    logger.debug("ファイル %s のキャッシュID: %s", os.path.basename(file_path), cache_id)
     return cache_id
 
 
+def _cache_file_path(file_path, cache_id):
+    """キャッシュファイルのパスを返す（ディレクトリは作成しない）。"""
+    base_name = os.path.splitext(os.path.basename(file_path))[0]
+    cache_dir = resolve_base_dir(os.path.dirname(file_path)) / "results_AAT" / "cache"
+    return os.path.join(cache_dir, f"{base_name}_{cache_id}.pickle")
+
+
 def get_cache_path(file_path, cache_id):
     """
     キャッシュファイルのパスを生成する
@@ -122,21 +344,20 @@ def get_cache_path(file_path, cache_id):
     Returns:
         str: キャッシュファイルのパス
     """
-    # CSVファイルのディレクトリを取得
-    csv_dir = os.path.dirname(file_path)
-    base_name = os.path.splitext(os.path.basename(file_path))[0]
-
-    # キャッシュディレクトリのパスを生成
-    cache_dir = ensure_cache_dir(csv_dir)
+    # キャッシュディレクトリを作成してからパスを返す
+    ensure_cache_dir(os.path.dirname(file_path))
+    return _cache_file_path(file_path, cache_id)
 
-    # キャッシュファイルのパスを生成
-    cache_file = f"{base_name}_{cache_id}.pickle"
-    cache_path = os.path.join(cache_dir, cache_file)
 
-    return cache_path
+def _wait_for_pending_write(file_path):
+    """指定ファイルのバックグラウンド書き込みが残っていれば完了まで待つ。"""
+    with _pending_lock:
+        future = _pending_writes.get(os.path.abspath(file_path))
+    if future is not None:
+        future.result()
 
 
-def save_to_cache(processed_data, file_path, cache_id, config):
+def save_to_cache(processed_data, file_path, cache_id, config, background=False, file_stat=None):
     """
     処理済みデータをキャッシュとして保存する
 
@@ -145,71 +366,105 @@ def save_to_cache(processed_data, file_path, cache_id, config):
         file_path (str): 元のCSVファイルのパス
         cache_id (str): キャッシュID
         config (dict): 現在の設定情報
+        background (bool): Trueの場合、書き込みをバックグラウンドスレッドに任せてすぐに戻る
+        file_stat (os.stat_result, optional): `generate_cache_id` に渡したものと同じ `os.stat` の結果
 
     Returns:
-        bool: 保存に成功した場合はTrue、失敗した場合はFalse
+        bool: 保存に成功した（バックグラウンドの場合は書き込みを登録できた）場合はTrue、失敗した場合はFalse
+    """
+    if not background:
+        # 同期保存では辞書を複製せず、書き込み中だけ一時的に差し替えて元に戻す
+        return _write_cache(processed_data, file_path, cache_id, config, file_stat)
+
+    # 書き込み中に呼び出し元が辞書を書き換えても影響しないよう、トップレベルだけ複製しておく
+    data_to_save = dict(processed_data)
+    key = os.path.abspath(file_path)
+    try:
+        future = _writer.submit(_write_cache, data_to_save, file_path, cache_id, config, file_stat)
+    except RuntimeError as e:
+        # 終了処理中などで登録できない場合は同期的に書き込む
+        logger.debug("バックグラウンド書き込みを登録できないため同期保存します: %s", e)
+        return _write_cache(data_to_save, file_path, cache_id, config, file_stat)
+
+    with _pending_lock:
+        _pending_writes[key] = future
+
+    def _forget(done_future):
+        with _pending_lock:
+            if _pending_writes.get(key) is done_future:
+                del _pending_writes[key]
+
+    future.add_done_callback(_forget)
+    return True
+
+
+def _write_cache(data_to_save, file_path, cache_id, config, file_stat=None):
+    """
+    キャッシュを書き込む（`save_to_cache` の本体）
+
+    `data_to_save` の `raw_data` と `_metadata` は書き込み中だけ差し替え、終了時に元へ戻す。
     """
     try:
         # 新しいキャッシュを保存する前に、同じファイルの古いキャッシュを削除
-        delete_cache(file_path)
-        logger.debug(f"古いキャッシュを削除しました: {os.path.basename(file_path)}")
+        _delete_cache_files(file_path)
+        logger.debug("古いキャッシュを削除しました: %s", os.path.basename(file_path))
 
         cache_path = get_cache_path(file_path, cache_id)
+        if file_stat is None:
+            file_stat = os.stat(file_path)
 
         # キャッシュメタデータを準備
         cache_metadata = {
             "created_at": datetime.now().isoformat(),
             "file_path": file_path,
-            "file_mtime": os.path.getmtime(file_path),
+            "file_mtime": file_stat.st_mtime,
+            "file_size": file_stat.st_size,
             "app_version": APP_VERSION,
-            "config": {
-                key: config.get(key)
-                for key in [
-                    "time_column",
-                    "acceleration_column_inner_capsule",
-                    "acceleration_column_drag_shield",
-                    "use_inner_acceleration",
-                    "use_drag_acceleration",
-                    "sampling_rate",
-                    "gravity_constant",
-                    "acceleration_threshold",
-                    "end_gravity_level",
-                    "min_seconds_after_start",
-                    "invert_inner_acceleration",
-                ]
-            },
+            "config": {key: config.get(key) for key in _CACHE_RELEVANT_KEYS},
         }
 
-        # 保存する前に大きなデータをコピー
-        data_to_save = copy.deepcopy(processed_data)
-
         # Pandasオブジェクトが安全に保存されているか確認
         raw_data_cache_path = None
-        if "raw_data" in data_to_save:
+        has_raw_data = "raw_data" in data_to_save
+        original_raw_data = data_to_save.get("raw_data")
+        if has_raw_data:
             # rawデータはサイズが大きいため、サイズ削減のためにhdfで保存
-            cache_path_obj = Path(cache_path)
-            raw_data_cache_path = cache_path_obj.with_name(cache_path_obj.stem + "_raw.h5")
-            data_to_save["raw_data"].to_hdf(raw_data_cache_path, key="raw_data", mode="w")
-            data_to_save["raw_data"] = None  # pickleには保存しないよう置き換え
-
-        # メタデータを追加
-        data_to_save["_metadata"] = cache_metadata
+            raw_data_cache_path = _raw_data_path(cache_path)
+            raw_data = original_raw_data
+            if config.get("cache_downcast", True):
+                raw_data = _downcast_raw_data(raw_data)
+            raw_data.to_hdf(
+                raw_data_cache_path,
+                key="raw_data",
+                mode="w",
+                complib=_HDF_COMPLIB,
+                complevel=_HDF_COMPLEVEL,
+            )
 
-        # キャッシュに保存（失敗時はHDF5ファイルも削除）
         try:
-            with open(cache_path, "wb") as f:
-                pickle.dump(data_to_save, f)
+            if has_raw_data:
+                data_to_save["raw_data"] = None  # pickleには保存しないよう置き換え
+            # メタデータを追加
+            data_to_save["_metadata"] = cache_metadata
+
+            # キャッシュに保存（失敗時はHDF5ファイルも削除）
+            _dump_cache_pickle(data_to_save, cache_path)
         except Exception:
             # pickle保存に失敗した場合、先に書いたHDF5を掃除
             if raw_data_cache_path is not None and raw_data_cache_path.exists():
                 try:
                     raw_data_cache_path.unlink()
-                    logger.warning(f"pickle保存失敗のため孤立HDF5を削除: {raw_data_cache_path}")
+                    logger.warning("pickle保存失敗のため孤立HDF5を削除: %s", raw_data_cache_path)
                 except OSError:
-                    logger.error(f"孤立HDF5の削除に失敗: {raw_data_cache_path}")
+                    logger.error("孤立HDF5の削除に失敗: %s", raw_data_cache_path)
             raise
+        finally:
+            # 呼び出し元の辞書を元に戻す
+            data_to_save.pop("_metadata", None)
+            if has_raw_data:
+                data_to_save["raw_data"] = original_raw_data
 
-        logger.info(f"データをキャッシュに保存しました: {cache_path}")
+        logger.info("データをキャッシュに保存しました: %s", cache_path)
         return True
 
     except Exception as e:
@@ -229,35 +484,36 @@ def load_from_cache(file_path, cache_id):
         dict or None: 処理済みのデータ、またはキャッシュが存在しない場合はNone
     """
     try:
+        _wait_for_pending_write(file_path)
         cache_path = get_cache_path(file_path, cache_id)
 
         # キャッシュファイルが存在するか確認
         if not os.path.exists(cache_path):
-            logger.debug(f"キャッシュファイルが見つかりません: {cache_path}")
+            logger.debug("キャッシュファイルが見つかりません: %s", cache_path)
             return None
 
         # キャッシュからデータを読み込み
-        with open(cache_path, "rb") as f:
-            data = _safe_pickle_load(f)
+        data = _load_cache_pickle(cache_path)
 
         # メタデータを確認
         metadata = data.get("_metadata", {})
         if metadata.get("app_version") != APP_VERSION:
             logger.warning(
-                f"キャッシュのバージョン({metadata.get('app_version')})が現在のバージョン({APP_VERSION})と一致しません"
+                "キャッシュのバージョン(%s)が現在のバージョン(%s)と一致しません",
+                metadata.get("app_version"),
+                APP_VERSION,
             )
             return None
 
-        logger.info(f"キャッシュからデータを読み込みました: {cache_path}")
+        logger.info("キャッシュからデータを読み込みました: %s", cache_path)
 
         # raw_dataがあれば復元
         if "raw_data" in data and data["raw_data"] is None:
-            cache_path_obj = Path(cache_path)
-            raw_data_cache_path = cache_path_obj.with_name(cache_path_obj.stem + "_raw.h5")
+            raw_data_cache_path = _raw_data_path(cache_path)
             if os.path.exists(raw_data_cache_path):
                 try:
                     data["raw_data"] = pd.read_hdf(raw_data_cache_path, key="raw_data")
-                    logger.debug(f"raw_dataを復元しました: {raw_data_cache_path}")
+                    logger.debug("raw_dataを復元しました: %s", raw_data_cache_path)
                 except Exception as e:
                     log_exception(e, "raw_dataの復元中にエラーが発生しました")
                     # raw_dataの読み込みに失敗した場合、データの整合性が保証されないため、キャッシュ全体を無効化
@@ -286,6 +542,12 @@ def delete_cache(file_path, cache_id=None):
     Returns:
         bool: 削除に成功した場合はTrue、失敗した場合はFalse
     """
+    _wait_for_pending_write(file_path)
+    return _delete_cache_files(file_path, cache_id)
+
+
+def _delete_cache_files(file_path, cache_id=None):
+    """キャッシュファイルを削除する（`delete_cache` の本体）。書き込み待ちは確認しない。"""
     try:
         csv_dir = os.path.dirname(file_path)
         base_name = os.path.splitext(os.path.basename(file_path))[0]
@@ -293,30 +555,36 @@ def delete_cache(file_path, cache_id=None):
 
         # キャッシュディレクトリが存在するか確認
         if not cache_dir.exists():
-            logger.debug(f"キャッシュディレクトリが見つかりません: {cache_dir}")
+            logger.debug("キャッシュディレクトリが見つかりません: %s", cache_dir)
             return False
 
         if cache_id:
             # 特定のキャッシュだけを削除
             cache_path = get_cache_path(file_path, cache_id)
             cache_path_obj = Path(cache_path)
-            raw_data_cache_path = cache_path_obj.with_name(cache_path_obj.stem + "_raw.h5")
+            raw_data_cache_path = _raw_data_path(cache_path)
 
             if cache_path_obj.exists():
                 cache_path_obj.unlink()
-                logger.info(f"キャッシュを削除しました: {cache_path}")
+                logger.info("キャッシュを削除しました: %s", cache_path)
 
             if raw_data_cache_path.exists():
                 raw_data_cache_path.unlink()
-                logger.info(f"raw_dataキャッシュを削除しました: {raw_data_cache_path}")
+                logger.info("raw_dataキャッシュを削除しました: %s", raw_data_cache_path)
+
+            _buffers_path(cache_path).unlink(missing_ok=True)
         else:
             # このファイルの全てのキャッシュを削除
             cache_pattern = f"{base_name}_"
-            for filename in os.listdir(cache_dir):
-                if filename.startswith(cache_pattern) and filename.endswith((".pickle", "_raw.h5")):
-                    target_path = cache_dir / filename
-                    target_path.unlink()
-                    logger.info(f"キャッシュを削除しました: {target_path}")
+            with os.scandir(cache_dir) as entries:
+                target_paths = [
+                    entry.path
+                    for entry in entries
+                    if entry.name.startswith(cache_pattern) and entry.name.endswith((".pickle", ".buf", "_raw.h5"))
+                ]
+            for target_path in target_paths:
+                os.remove(target_path)
+                logger.info("キャッシュを削除しました: %s", target_path)
 
         return True
 
@@ -325,49 +593,101 @@ def delete_cache(file_path, cache_id=None):
         return False
 
 
-def has_valid_cache(file_path, config):
+def _probe_cache(file_path, config):
     """
-    有効なキャッシュが存在するか確認する
-
-    Args:
-        file_path (str): 元のCSVファイルのパス
-        config (dict): 現在の設定情報
+    キャッシュファイルの有無だけを確認する（`has_valid_cache` の本体）
 
-    Returns:
-        tuple: (キャッシュが存在する場合はTrue、キャッシュID)
+    ディレクトリの作成などの副作用はなく、結果はDEBUGレベルでのみ記録する。
     """
     try:
         if not config.get("use_cache", True):
             return False, None
 
+        _wait_for_pending_write(file_path)
         cache_id = generate_cache_id(file_path, config)
-        cache_path = get_cache_path(file_path, cache_id)
+        cache_path = _cache_file_path(file_path, cache_id)
 
+        # IDが更新時間とバージョンを含むため、ファイルの存在だけで有効性を判定できる
         if os.path.exists(cache_path):
-            # キャッシュファイルが存在する場合、その有効性を確認
-            with open(cache_path, "rb") as f:
-                data = _safe_pickle_load(f)
-
-            # メタデータを確認
-            metadata = data.get("_metadata", {})
-            if metadata.get("app_version") != APP_VERSION:
-                logger.warning(
-                    f"キャッシュのバージョン({metadata.get('app_version')})が現在のバージョン({APP_VERSION})と一致しません"
-                )
-                return False, cache_id
-
-            # ファイルの最終更新時間を確認
-            file_mtime = os.path.getmtime(file_path)
-            if metadata.get("file_mtime") != file_mtime:
-                logger.warning(f"ファイルが更新されています: {file_path}")
-                return False, cache_id
-
-            logger.info(f"有効なキャッシュが見つかりました: {cache_path}")
+            logger.debug("キャッシュが見つかりました: %s", cache_path)
             return True, cache_id
-        else:
-            logger.debug(f"キャッシュが見つかりません: {cache_path}")
-            return False, cache_id
+
+        logger.debug("キャッシュが見つかりません: %s", cache_path)
+        return False, cache_id
 
     except Exception as e:
         log_exception(e, "キャッシュの確認中にエラーが発生しました")
         return False, None
+
+
+def has_valid_cache(file_path, config):
+    """
+    有効なキャッシュが存在するか確認する
+
+    Args:
+        file_path (str): 元のCSVファイルのパス
+        config (dict): 現在の設定情報
+
+    Returns:
+        tuple: (キャッシュが存在する場合はTrue、キャッシュID)
+    """
+    is_valid, cache_id = _probe_cache(file_path, config)
+    if is_valid:
+        logger.info("有効なキャッシュが見つかりました: %s", _cache_file_path(file_path, cache_id))
+    return is_valid, cache_id
+
+
+def has_valid_cache_bulk(file_paths, config, max_workers=None):
+    """
+    複数ファイルのキャッシュの有効性をまとめて確認する
+
+    各ファイルの確認はstatと存在確認のみのI/O待ちが中心なため、スレッドで並行に行う。
+    キャッシュディレクトリの作成などの副作用はなく、ファイルごとの結果はDEBUGレベルでのみ記録する。
+
+    Args:
+        file_paths (Iterable[str]): 元のCSVファイルのパス
+        config (dict): 現在の設定情報
+        max_workers (int, optional): 並行数。省略時は設定の `cache_scan_workers`、
+            それもなければCPU数の4倍（最大32）
+
+    Returns:
+        dict: ファイルパスごとの `has_valid_cache` の結果
+    """
+    file_paths = list(dict.fromkeys(file_paths))
+    if not file_paths:
+        return {}
+
+    if max_workers is None:
+        max_workers = config.get("cache_scan_workers") or min(32, (os.cpu_count() or 1) * 4)
+    max_workers = max(1, min(max_workers, len(file_paths)))
+
+    if max_workers == 1:
+        return {file_path: _probe_cache(file_path, config) for file_path in file_paths}
+
+    with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="cache-scan") as executor:
+        results = executor.map(lambda file_path: _probe_cache(file_path, config), file_paths)
+        return dict(zip(file_paths, results, strict=True))
+
+
+def open_cache(file_path, config):
+    """
+    キャッシュの検証と読み込みを一度に行う
+
+    キャッシュIDに対応するファイルの有無で有効性を確認し、有効な場合のみ
+    pickleを読み込む。無効なキャッシュはデシリアライズしない。
+
+    Args:
+        file_path (str): 元のCSVファイルのパス
+        config (dict): 現在の設定情報
+
+    Returns:
+        tuple: (処理済みのデータまたはNone、キャッシュが有効に読み込めた場合はTrue)
+    """
+    is_valid, cache_id = has_valid_cache(file_path, config)
+    if not is_valid:
+        return None, False
+
+    data = load_from_cache(file_path, cache_id)
+    if data is None:
+        return None, False
+    return data, True
@@ -8,6 +8,7 @@
 
 from __future__ import annotations
 
+import copy
 import json
 import os
 import shutil
@@ -19,9 +20,49 @@ from typing import Any
 from core.logger import get_logger, log_exception
 from core.version import APP_VERSION
 
+try:  # 任意依存: orjsonがインストールされていれば設定ファイルの解析と書き出しに使う
+    import orjson
+except ModuleNotFoundError:  # pragma: no cover - orjson未導入環境
+    orjson = None  # type: ignore
+
 # ロガーの初期化
 logger = get_logger("config")
 
+# 組み込みのデフォルト設定（config/config.default.jsonが見つからない場合もこの値を使う）
+_DEFAULT_CONFIG: dict[str, Any] = {
+    "time_column": "データセット1:時間(s)",
+    "acceleration_column_inner_capsule": "データセット1:Z-axis acceleration 1(m/s²)",
+    "acceleration_column_drag_shield": "データセット1:Z-axis acceleration 2(m/s²)",
+    "use_inner_acceleration": True,
+    "use_drag_acceleration": True,
+    "sampling_rate": 1000,
+    "gravity_constant": 9.797578,
+    "ylim_min": -1.0,
+    "ylim_max": 1.0,
+    "acceleration_threshold": 5.0,
+    "end_gravity_level": 8.0,
+    "window_size": 0.1,
+    "g_quality_start": 0.1,
+    "g_quality_end": 1.0,
+    "g_quality_step": 0.05,
+    "min_seconds_after_start": 0.7,
+    "auto_calculate_g_quality": True,
+    "use_cache": True,
+    "default_graph_duration": 1.45,
+    "graph_sensor_mode": "both",
+    "theme": "system",
+    "export_figure_width": 10.6,
+    "export_figure_height": 3.4,
+    "export_dpi": 300,
+    "export_bbox_inches": None,
+    "invert_inner_acceleration": True,
+    "use_float32": False,
+    "app_version": APP_VERSION,
+}
+
+# 読み込み済み設定のキャッシュ（(デフォルト設定とユーザー設定のパス・更新時刻), 設定）
+_config_cache: tuple[tuple, dict[str, Any]] | None = None
+
 
 def _get_app_root() -> Path:
     if getattr(sys, "frozen", False) and hasattr(sys, "_MEIPASS"):
@@ -75,6 +116,55 @@ def _migrate_legacy_config(user_config_path: Path, backup_path: Path) -> None:
         logger.warning("旧設定ファイルの移行に失敗しました: %s", exc)
 
 
+def _read_json(path: Path) -> Any:
+    """
+    JSONファイルを読み込む
+
+    orjsonが利用可能な場合はそちらで解析する。解析エラーはどちらの場合も
+    json.JSONDecodeError（orjson.JSONDecodeErrorはそのサブクラス）として送出される。
+    """
+    if orjson is not None:
+        return orjson.loads(path.read_bytes())
+    with path.open("r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def _dump_json(obj: Any) -> bytes:
+    """
+    JSONをUTF-8のバイト列に変換する
+
+    orjsonが利用可能な場合はそちらで変換する。出力がどちらでも同じ形式になるよう、
+    インデントはorjsonが対応する2スペースにそろえる。
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY)
+    return json.dumps(obj, indent=2, ensure_ascii=False).encode("utf-8")
+
+
+def _config_cache_key(default_config_path: Path, user_config_path: Path) -> tuple | None:
+    """設定キャッシュのキーとして両ファイルのパスと更新時刻を返す。どちらかが読めなければNone。"""
+    try:
+        return (
+            str(default_config_path),
+            default_config_path.stat().st_mtime_ns,
+            str(user_config_path),
+            user_config_path.stat().st_mtime_ns,
+        )
+    except OSError:
+        return None
+
+
+def _merge_user_config(default_config: dict[str, Any], user_config: dict[str, Any]) -> None:
+    """デフォルト設定に存在するキーだけをユーザー設定の値で上書きする。"""
+    default_config.update((key, user_config[key]) for key in default_config.keys() & user_config.keys())
+
+
+def clear_config_cache() -> None:
+    """読み込み済み設定のキャッシュを破棄する。"""
+    global _config_cache
+    _config_cache = None
+
+
 def load_config(on_warning: Callable[[str], None] | None = None) -> dict[str, Any]:
     """
     設定ファイルを読み込む
@@ -87,6 +177,7 @@ def load_config(on_warning: Callable[[str], None] | None = None) -> dict[str, An
     Returns:
         dict: 設定情報を含む辞書
     """
+    global _config_cache
     warn = on_warning or (lambda msg: logger.warning("%s", msg))
 
     app_root = _get_app_root()
@@ -98,49 +189,25 @@ def load_config(on_warning: Callable[[str], None] | None = None) -> dict[str, An
 
     _migrate_legacy_config(user_config_path, backup_path)
 
-    logger.debug(f"デフォルト設定ファイルのパス: {default_config_path}")
-    logger.debug(f"ユーザー設定ファイルのパス: {user_config_path}")
+    # どちらの設定ファイルも前回の読み込みから変わっていなければ、解析済みの設定を返す
+    cache_key = _config_cache_key(default_config_path, user_config_path)
+    if cache_key is not None and _config_cache is not None and _config_cache[0] == cache_key:
+        logger.debug("設定ファイルに変更がないため、読み込み済みの設定を使用します")
+        return copy.deepcopy(_config_cache[1])
+
+    logger.debug("デフォルト設定ファイルのパス: %s", default_config_path)
+    logger.debug("ユーザー設定ファイルのパス: %s", user_config_path)
 
-    # デフォルト設定を読み込み
+    # 組み込みのデフォルト設定に、config.default.jsonの内容があれば上書きする
+    default_config = copy.deepcopy(_DEFAULT_CONFIG)
     try:
-        with default_config_path.open("r", encoding="utf-8") as f:
-            logger.info("デフォルト設定ファイルを読み込んでいます")
-            default_config = json.load(f)
-            logger.debug(f"読み込まれたデフォルト設定: {default_config}")
+        logger.info("デフォルト設定ファイルを読み込んでいます")
+        default_config.update(_read_json(default_config_path))
+        logger.debug("読み込まれたデフォルト設定: %s", default_config)
     except FileNotFoundError:
-        logger.error(f"デフォルト設定ファイルが見つかりません: {default_config_path}")
-        # フォールバック用のハードコードされたデフォルト設定
-        default_config = {
-            "time_column": "データセット1:時間(s)",
-            "acceleration_column_inner_capsule": "データセット1:Z-axis acceleration 1(m/s²)",
-            "acceleration_column_drag_shield": "データセット1:Z-axis acceleration 2(m/s²)",
-            "use_inner_acceleration": True,
-            "use_drag_acceleration": True,
-            "sampling_rate": 1000,
-            "gravity_constant": 9.797578,
-            "ylim_min": -1.0,
-            "ylim_max": 1.0,
-            "acceleration_threshold": 5.0,
-            "end_gravity_level": 8.0,
-            "window_size": 0.1,
-            "g_quality_start": 0.1,
-            "g_quality_end": 1.0,
-            "g_quality_step": 0.05,
-            "min_seconds_after_start": 0.7,
-            "auto_calculate_g_quality": True,
-            "use_cache": True,
-            "default_graph_duration": 1.45,
-            "graph_sensor_mode": "both",
-            "theme": "system",
-            "export_figure_width": 10.6,
-            "export_figure_height": 3.4,
-            "export_dpi": 300,
-            "export_bbox_inches": None,
-            "invert_inner_acceleration": True,
-            "app_version": APP_VERSION,
-        }
+        logger.error("デフォルト設定ファイルが見つかりません: %s", default_config_path)
     except json.JSONDecodeError as e:
-        logger.error(f"デフォルト設定ファイルの解析に失敗しました: {e}")
+        logger.error("デフォルト設定ファイルの解析に失敗しました: %s", e)
         raise
 
     # バージョン情報は常に最新を使用
@@ -152,51 +219,64 @@ def load_config(on_warning: Callable[[str], None] | None = None) -> dict[str, An
         try:
             user_config_dir.mkdir(parents=True, exist_ok=True)
             shutil.copy2(default_config_path, user_config_path)
-            logger.info(f"デフォルト設定をユーザー設定としてコピーしました: {user_config_path}")
+            logger.info("デフォルト設定をユーザー設定としてコピーしました: %s", user_config_path)
         except Exception as e:
-            logger.warning(f"ユーザー設定ファイルの作成に失敗しました: {e}")
+            logger.warning("ユーザー設定ファイルの作成に失敗しました: %s", e)
 
-    # ユーザー設定を読み込み
+    # ユーザー設定を読み込み（キャッシュキーは読み込み前の状態で取る）
+    cache_key = _config_cache_key(default_config_path, user_config_path)
+    loaded_cleanly = False
     try:
-        with user_config_path.open("r", encoding="utf-8") as f:
-            logger.info("ユーザー設定ファイルを読み込んでいます")
-            user_config = json.load(f)
-            logger.debug(f"読み込まれたユーザー設定: {user_config}")
+        logger.info("ユーザー設定ファイルを読み込んでいます")
+        user_config = _read_json(user_config_path)
+        logger.debug("読み込まれたユーザー設定: %s", user_config)
 
-        # ユーザー設定でデフォルト設定を上書き
-        for key in default_config:
-            if key in user_config:
-                default_config[key] = user_config[key]
+        # ユーザー設定でデフォルト設定を上書き（デフォルトに存在するキーのみ）
+        _merge_user_config(default_config, user_config)
 
         # バージョン情報は常に最新を使用
         default_config["app_version"] = APP_VERSION
 
         logger.info("設定ファイルの読み込みに成功しました")
+        loaded_cleanly = True
     except FileNotFoundError:
-        logger.warning(f"ユーザー設定ファイルが見つかりません: {user_config_path}")
+        logger.warning("ユーザー設定ファイルが見つかりません: %s", user_config_path)
         logger.info("デフォルト設定を使用します")
     except json.JSONDecodeError as e:
-        logger.error(f"ユーザー設定ファイルの解析に失敗しました: {e}")
+        logger.error("ユーザー設定ファイルの解析に失敗しました: %s", e)
         # バックアップからの復元を試みる
         if backup_path.exists():
             try:
-                with backup_path.open("r", encoding="utf-8") as bf:
-                    user_config = json.load(bf)
+                user_config = _read_json(backup_path)
                 logger.info("バックアップから設定を復元しました: %s", backup_path)
                 shutil.copy2(backup_path, user_config_path)
-                for key in default_config:
-                    if key in user_config:
-                        default_config[key] = user_config[key]
+                _merge_user_config(default_config, user_config)
                 default_config["app_version"] = APP_VERSION
             except Exception:
                 warn(f"ユーザー設定ファイルの解析に失敗しました: {user_config_path}\nデフォルト設定を使用します。")
         else:
             warn(f"ユーザー設定ファイルの解析に失敗しました: {user_config_path}\nデフォルト設定を使用します。")
 
-    logger.debug(f"最終的な設定: {default_config}")
+    logger.debug("最終的な設定: %s", default_config)
+
+    # 警告なしで読み込めた場合のみキャッシュする
+    if loaded_cleanly and cache_key is not None:
+        _config_cache = (cache_key, copy.deepcopy(default_config))
+
     return default_config
 
 
+def _clean_floats(obj: Any) -> Any:
+    """浮動小数点数の表現誤差（0.6800000000000002など）を丸めて取り除く"""
+    if isinstance(obj, dict):
+        return {k: _clean_floats(v) for k, v in obj.items()}
+    if isinstance(obj, list):
+        return [_clean_floats(item) for item in obj]
+    if isinstance(obj, float):
+        return round(obj, 10)
+    return obj
+
+
 def save_config(config: dict[str, Any], on_error: Callable[[str], None] | None = None) -> bool:
     """
     設定ファイルを保存する
@@ -218,29 +298,20 @@ def save_config(config: dict[str, Any], on_error: Callable[[str], None] | None =
 
     user_config_dir.mkdir(parents=True, exist_ok=True)
 
-    logger.debug(f"設定を保存します: {config}")
+    logger.debug("設定を保存します: %s", config)
+
+    # 保存後は必ずファイルから読み直す
+    clear_config_cache()
 
     try:
         # 既存の設定ファイルがあればバックアップ
         if config_path.exists():
             shutil.copy2(config_path, backup_path)
-            logger.debug(f"設定ファイルをバックアップしました: {backup_path}")
+            logger.debug("設定ファイルをバックアップしました: %s", backup_path)
 
         # 浮動小数点精度問題を修正してからシリアライズ
-        def _clean_floats(obj):
-            if isinstance(obj, dict):
-                return {k: _clean_floats(v) for k, v in obj.items()}
-            if isinstance(obj, list):
-                return [_clean_floats(item) for item in obj]
-            if isinstance(obj, float):
-                return round(obj, 10)
-            return obj
-
-        config_str = json.dumps(_clean_floats(config), indent=4, ensure_ascii=False)
-
-        with config_path.open("w", encoding="utf-8") as f:
-            f.write(config_str)
-        logger.info(f"設定ファイルを正常に保存しました: {config_path}")
+        config_path.write_bytes(_dump_json(_clean_floats(config)))
+        logger.info("設定ファイルを正常に保存しました: %s", config_path)
         return True
     except Exception as e:
         log_exception(e, "設定の保存中にエラーが発生しました")
@@ -249,7 +320,7 @@ def save_config(config: dict[str, Any], on_error: Callable[[str], None] | None =
         if backup_path.exists():
             try:
                 shutil.copy2(backup_path, config_path)
-                logger.info(f"バックアップから設定を復元しました: {backup_path}")
+                logger.info("バックアップから設定を復元しました: %s", backup_path)
             except Exception as e2:
                 log_exception(e2, "バックアップからの復元に失敗しました")
 
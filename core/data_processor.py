@@ -6,18 +6,189 @@ CSVファイルからのデータ読み込み、列の自動検出、重力レ
 およびデータのフィルタリング機能を提供します。
 """
 
+import functools
+import logging
+import os
 import re
+from collections.abc import Callable
+from dataclasses import dataclass
 from typing import Any
 
 import numpy as np
 import pandas as pd
 
+try:  # 任意依存: pyarrowがインストールされていればCSVをマルチスレッドで解析する
+    import pyarrow
+except ModuleNotFoundError:  # pragma: no cover - pyarrow未導入環境
+    pyarrow = None  # type: ignore
+
 from core.exceptions import ColumnNotFoundError, DataLoadError, DataProcessingError
 from core.logger import get_logger, log_exception
 
 # モジュール用のロガーを初期化
 logger = get_logger("data_processor")
 
+# 列候補の検出で数値型の判定に使う先頭行数
+_DETECT_SAMPLE_ROWS = 200
+
+# 時間列・加速度列の候補とみなすカラム名のパターン（単語境界マッチング）
+_TIME_PATTERN = re.compile(r"\btime|\bsec\b|\bt\b|\bs\b|時間|秒", re.IGNORECASE)
+_ACCEL_PATTERN = re.compile(r"\bacc|\bacceleration|\ba\b|\bg\b|加速度", re.IGNORECASE)
+
+# 閾値の通過位置を探すときに一度に判定する要素数
+_SCAN_BLOCK = 1 << 15
+
+
+def _first_true(condition: Any) -> int:
+    """
+    真となる最初の位置を返す（見つからない場合は-1）
+
+    `np.where(condition)[0][0]` と異なり、候補位置の配列を確保しない。
+    """
+    condition = np.asarray(condition)
+    if condition.size == 0:
+        return -1
+    index = int(np.argmax(condition))
+    return index if condition[index] else -1
+
+
+def _first_index(values: np.ndarray, predicate: Callable[[np.ndarray], np.ndarray], start: int = 0) -> int:
+    """
+    `values[start:]` で `predicate` が真となる最初の位置を返す（見つからない場合は-1）
+
+    配列全体の真偽値配列は作らず、`_SCAN_BLOCK` 要素ずつ判定して見つかった時点で打ち切る。
+    同期点や終了点は多くの場合データの先頭付近にあるため、走査量が大きく減る。
+    """
+    for block_start in range(max(start, 0), len(values), _SCAN_BLOCK):
+        hit = _first_true(predicate(values[block_start : block_start + _SCAN_BLOCK]))
+        if hit >= 0:
+            return block_start + hit
+    return -1
+
+
+def find_sync_index(acceleration: Any, threshold: float) -> int:
+    """
+    加速度の絶対値が閾値を下回る最初の位置（同期点）を返す
+
+    ブロック単位で走査し、見つかった時点で打ち切るため、配列全体の真偽値配列は確保しません。
+
+    Args:
+        acceleration (array-like): 加速度データ
+        threshold (float): 同期点を判定する加速度の閾値
+
+    Returns:
+        int: 同期点のインデックス。見つからない場合は-1
+    """
+    values = np.asarray(acceleration)
+    return _first_index(values, lambda block: np.abs(block) < threshold)
+
+
+def _scan_and_normalize(
+    acceleration: np.ndarray, threshold: float, scale: float, dtype: type[np.floating] = np.float64
+) -> tuple[int, np.ndarray]:
+    """
+    加速度系列から同期点を探し、重力レベルに変換する
+
+    scaleには重力定数の逆数（上下反転補正を行う場合は符号を反転した値）を渡す。
+    同期点は加速度の絶対値で判定するため、符号の反転は結果に影響しない。
+    重力レベルはdtypeの精度で出力する（型変換と乗算を1回の走査で行う）。
+
+    Returns:
+        同期点（加速度の絶対値が閾値を下回る最初の位置、見つからない場合は-1）と重力レベル
+    """
+    sync_index = find_sync_index(acceleration, threshold)
+    return sync_index, np.multiply(acceleration, scale, dtype=dtype)
+
+
+def _read_csv(file_path: str, **kwargs: Any) -> pd.DataFrame:
+    """
+    CSVファイルを読み込む
+
+    pyarrowが利用可能な場合はまずpyarrowエンジンで解析し、失敗した場合（UTF-8以外の
+    エンコーディングや、pyarrowが扱えない形式）は従来のCエンジンで読み直す。
+    Cエンジンではファイルをメモリマップして読み込み、cp932での再試行や続けて行われる
+    読み込みでもOSのページキャッシュをそのまま使う。UTF-8で読み込めない場合は
+    cp932で再試行する。
+    """
+    if pyarrow is not None and "nrows" not in kwargs:
+        try:
+            return pd.read_csv(file_path, engine="pyarrow", **kwargs)
+        except (UnicodeDecodeError, pd.errors.ParserError, pyarrow.ArrowInvalid) as e:
+            logger.debug("pyarrowでの解析に失敗したため標準のパーサで再試行します: %s", e)
+
+    kwargs.setdefault("memory_map", True)
+    try:
+        return pd.read_csv(file_path, **kwargs)
+    except UnicodeDecodeError:
+        logger.warning("UTF-8での読み込みに失敗しました。cp932で再試行します: %s", file_path)
+        return pd.read_csv(file_path, encoding="cp932", **kwargs)
+
+
+@dataclass(frozen=True)
+class _ParsedCsv:
+    """解析済みCSVの列名と列ごとのNumPy配列（共有されるため読み取り専用）"""
+
+    columns: tuple[str, ...]
+    arrays: dict[str, np.ndarray]
+    length: int
+
+
+def _parse_csv(file_path: str, usecols: tuple[str, ...]) -> _ParsedCsv:
+    """
+    CSVファイルの指定列だけを浮動小数点数として解析する
+
+    解析結果は (パス, 更新時刻, サイズ, 列) ごとに再利用する。指定列が存在しない場合や
+    数値に変換できない場合は例外を送出する。
+    """
+    stat = os.stat(file_path)
+    return _parse_csv_cached(os.path.abspath(file_path), stat.st_mtime_ns, stat.st_size, usecols)
+
+
+@functools.lru_cache(maxsize=4)
+def _parse_csv_cached(file_path: str, mtime_ns: int, size: int, usecols: tuple[str, ...]) -> _ParsedCsv:
+    """`_parse_csv` の本体。直近のファイルだけを保持してメモリ使用量を抑える。"""
+    data = _read_csv(file_path, usecols=list(usecols), dtype=np.float64)
+    arrays: dict[str, np.ndarray] = {}
+    for column in data.columns:
+        values = data[column].to_numpy()
+        values.flags.writeable = False
+        arrays[column] = values
+    return _ParsedCsv(columns=tuple(data.columns), arrays=arrays, length=len(data))
+
+
+def read_raw_data(file_path: str) -> pd.DataFrame:
+    """
+    CSVファイル全体を読み込む
+
+    元のCSVデータ（エクスポート用の生データ）の読み込みに使う。読み込んだDataFrameは保持しない。
+    続けて同じファイルを処理する場合は、戻り値を load_and_process_data の raw_data に渡すと
+    CSVを再解析せずにその列を使う。
+
+    Args:
+        file_path (str): CSVファイルのパス
+
+    Returns:
+        pandas.DataFrame: CSVファイルの内容
+    """
+    return _read_csv(file_path)
+
+
+def _columns_from_frame(frame: pd.DataFrame, usecols: tuple[str, ...]) -> _ParsedCsv | None:
+    """読み込み済みのDataFrameから指定列を取り出す（無い場合や数値でない場合はNone）"""
+    if not set(usecols).issubset(frame.columns):
+        return None
+
+    arrays: dict[str, np.ndarray] = {}
+    try:
+        # 浮動小数点数の列はコピーせずに参照する（以降の計算は新しい配列に書き出すため元の列は変更しない）
+        for column in usecols:
+            arrays[column] = frame[column].to_numpy(np.float64)
+    except (TypeError, ValueError):
+        return None
+
+    ordered = tuple(column for column in frame.columns if column in arrays)
+    return _ParsedCsv(columns=ordered, arrays=arrays, length=len(frame))
+
 
 def detect_columns(file_path: str) -> tuple[list[str], list[str]]:
     """
@@ -25,6 +196,8 @@ def detect_columns(file_path: str) -> tuple[list[str], list[str]]:
 
     カラム名に基づいて時間データと加速度データの候補となる列を特定します。
     カラム名に明示的な情報がない場合は数値データ型の列を候補とします。
+    列名はヘッダーだけから判定し、名前で判定できない場合のみ先頭の数百行を読み込みます。
+    結果はファイルの更新時刻とサイズごとに再利用します。
 
     Args:
         file_path (str): CSVファイルのパス
@@ -38,55 +211,64 @@ def detect_columns(file_path: str) -> tuple[list[str], list[str]]:
         ValueError: 列検出中にエラーが発生した場合
     """
     try:
-        try:
-            data = pd.read_csv(file_path)
-        except UnicodeDecodeError:
-            logger.warning(f"UTF-8での読み込みに失敗しました。cp932で再試行します: {file_path}")
-            data = pd.read_csv(file_path, encoding="cp932")
+        stat = os.stat(file_path)
+        time_columns, acceleration_columns = _detect_columns_cached(
+            os.path.abspath(file_path), stat.st_mtime_ns, stat.st_size
+        )
+        return list(time_columns), list(acceleration_columns)
+
+    except Exception as e:
+        log_exception(e, "列候補の検出中にエラーが発生しました")
+        raise DataLoadError(file_path, "列候補の検出に失敗しました", e) from e
 
-        logger.debug(f"読み込んだCSVのカラム: {data.columns.tolist()}")
 
-        time_columns: list[str] = []
-        acceleration_columns: list[str] = []
+@functools.lru_cache(maxsize=64)
+def _detect_columns_cached(file_path: str, mtime_ns: int, size: int) -> tuple[tuple[str, ...], tuple[str, ...]]:
+    """
+    `detect_columns` の本体。(パス, 更新時刻, サイズ) ごとに結果をメモ化する。
+
+    テストなどでメモ化を破棄する場合は `_detect_columns_cached.cache_clear()` を呼ぶ。
+    """
+    # 列名の判定にはヘッダーだけを読み込む
+    columns = _read_csv(file_path, nrows=0).columns.tolist()
 
-        # カラム名に基づいて候補を検出（単語境界マッチング）
-        _time_pattern = re.compile(r"\btime|\bsec\b|\bt\b|\bs\b|時間|秒", re.IGNORECASE)
-        _accel_pattern = re.compile(r"\bacc|\bacceleration|\ba\b|\bg\b|加速度", re.IGNORECASE)
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("読み込んだCSVのカラム: %s", columns)
 
-        for column in data.columns:
-            col_lower = column.lower().strip()
+    time_columns: list[str] = []
+    acceleration_columns: list[str] = []
 
-            # 時間列の候補を検出（単語境界マッチング）
-            if _time_pattern.search(col_lower):
-                time_columns.append(column)
+    # カラム名に基づいて候補を検出（単語境界マッチング、大文字小文字は区別しない）
+    for column in columns:
+        # 時間列の候補を検出
+        if _TIME_PATTERN.search(column):
+            time_columns.append(column)
 
-            # 加速度列の候補を検出（単語境界マッチング）
-            if _accel_pattern.search(col_lower):
-                acceleration_columns.append(column)
+        # 加速度列の候補を検出
+        if _ACCEL_PATTERN.search(column):
+            acceleration_columns.append(column)
+
+    # 名前ベースの検出で候補がない場合だけ、先頭のサンプルで数値データ型のカラムを判定する
+    if not time_columns or not acceleration_columns:
+        sample = _read_csv(file_path, nrows=_DETECT_SAMPLE_ROWS)
+        numeric_columns = [column for column in sample.columns if pd.api.types.is_numeric_dtype(sample[column])]
 
-        # 名前ベースの検出で候補がない場合は、数値データ型のカラムを候補に追加
         if not time_columns:
-            for column in data.columns:
-                if pd.api.types.is_numeric_dtype(data[column]) and column not in acceleration_columns:
-                    time_columns.append(column)
+            time_columns = [column for column in numeric_columns if column not in acceleration_columns]
 
         if not acceleration_columns:
             # 時間列の候補を除外して、残りの数値カラムを加速度列の候補とする
-            for column in data.columns:
-                if pd.api.types.is_numeric_dtype(data[column]) and column not in time_columns:
-                    acceleration_columns.append(column)
-
-        logger.debug(f"検出された時間列候補: {time_columns}")
-        logger.debug(f"検出された加速度列候補: {acceleration_columns}")
+            acceleration_columns = [column for column in numeric_columns if column not in time_columns]
 
-        return time_columns, acceleration_columns
+    logger.debug("検出された時間列候補: %s", time_columns)
+    logger.debug("検出された加速度列候補: %s", acceleration_columns)
 
-    except Exception as e:
-        log_exception(e, "列候補の検出中にエラーが発生しました")
-        raise DataLoadError(file_path, "列候補の検出に失敗しました", e) from e
+    return tuple(time_columns), tuple(acceleration_columns)
 
 
-def load_and_process_data(file_path: str, config: dict[str, Any]) -> tuple[pd.Series, pd.Series, pd.Series, pd.Series]:
+def load_and_process_data(
+    file_path: str, config: dict[str, Any], raw_data: pd.DataFrame | None = None
+) -> tuple[pd.Series, pd.Series, pd.Series, pd.Series]:
     """
     CSVファイルからデータを読み込み、処理する
 
@@ -96,6 +278,8 @@ def load_and_process_data(file_path: str, config: dict[str, Any]) -> tuple[pd.Se
     Args:
         file_path (str): CSVファイルのパス
         config (dict): 設定情報
+        raw_data (pandas.DataFrame, optional): read_raw_data で読み込み済みのCSVの内容。
+            指定した場合はCSVを解析せずにその列を使う（raw_data自体は変更しない）
 
     Returns:
         tuple: 以下の4つの要素を含むタプル
@@ -104,19 +288,14 @@ def load_and_process_data(file_path: str, config: dict[str, Any]) -> tuple[pd.Se
             - pandas.Series: Drag Shieldの重力レベル
             - pandas.Series: Drag Shieldの調整済み時間データ
 
+        両系列の同期点が同じ場合、2つの調整済み時間データは読み取り専用の同じ配列を共有します。
+        値を変更する場合は `copy()` してから変更してください。
+
     Raises:
         ValueError: データ読み込み中にエラーが発生した場合
     """
-    logger.info(f"ファイルからデータを読み込み: {file_path}")
+    logger.info("ファイルからデータを読み込み: %s", file_path)
     try:
-        try:
-            data = pd.read_csv(file_path)
-        except UnicodeDecodeError:
-            logger.warning(f"UTF-8での読み込みに失敗しました。cp932で再試行します: {file_path}")
-            data = pd.read_csv(file_path, encoding="cp932")
-
-        logger.debug(f"読み込んだCSVのカラム: {data.columns.tolist()}")
-
         use_inner = config.get("use_inner_acceleration", True)
         use_drag = config.get("use_drag_acceleration", True)
 
@@ -125,92 +304,131 @@ def load_and_process_data(file_path: str, config: dict[str, Any]) -> tuple[pd.Se
                 "Inner CapsuleとDrag Shieldの両方の加速度計が無効です。いずれかを有効にしてください。"
             )
 
-        # 設定から列名を取得
+        # 設定値はCSVを読み込む前にまとめて取得・検証する
         time_column = config["time_column"]
         acceleration_inner_column = config["acceleration_column_inner_capsule"]
         acceleration_drag_column = config["acceleration_column_drag_shield"]
+        acceleration_threshold = config.get("acceleration_threshold", 1.0)  # デフォルト1m/s^2
+        invert_inner = config.get("invert_inner_acceleration", False)
+        # 重力レベルを単精度で保持する（時間は同期点の精度を保つため倍精度のまま）
+        gravity_dtype = np.float32 if config.get("use_float32", False) else np.float64
 
-        # 列が存在するか確認
-        missing_columns: list[str] = []
-        if time_column not in data.columns:
-            missing_columns.append(time_column)
-        if use_inner and acceleration_inner_column not in data.columns:
-            missing_columns.append(acceleration_inner_column)
-        if use_drag and acceleration_drag_column not in data.columns:
-            missing_columns.append(acceleration_drag_column)
-
-        if missing_columns:
-            # 呼び出し元で列選択ダイアログを表示するためにエラーを送出
-            raise ColumnNotFoundError(file_path, missing_columns, data.columns.tolist())
+        gravity_constant = config["gravity_constant"]
+        if gravity_constant == 0:
+            raise DataProcessingError("重力定数が0に設定されています。設定を確認してください。")
 
-        time = data[time_column]
+        required_columns = [time_column]
+        if use_inner:
+            required_columns.append(acceleration_inner_column)
+        if use_drag:
+            required_columns.append(acceleration_drag_column)
+
+        # 読み込み済みのデータがあればその列を使い、なければ必要な列だけを浮動小数点数として読み込む
+        # （同じファイル・列の再処理では解析結果を再利用する）
+        usecols = tuple(dict.fromkeys(required_columns))
+        data = _columns_from_frame(raw_data, usecols) if raw_data is not None else None
+        if data is None:
+            try:
+                data = _parse_csv(file_path, usecols)
+            except Exception:
+                # 列が存在しない場合は、ヘッダーだけを読み直して不足列を特定する
+                all_columns = _read_csv(file_path, nrows=0).columns.tolist()
+                missing_columns = [column for column in required_columns if column not in all_columns]
+                if missing_columns:
+                    # 呼び出し元で列選択ダイアログを表示するためにエラーを送出
+                    raise ColumnNotFoundError(file_path, missing_columns, all_columns) from None
+                raise
+
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("読み込んだCSVのカラム: %s", list(data.columns))
+
+        # 以降の計算はpandasのインデックス整列を介さず、NumPy配列のまま行う
+        time = np.asarray(data.arrays[time_column], dtype=np.float64)
         acceleration_inner_capsule = (
-            data[acceleration_inner_column]
-            if use_inner and acceleration_inner_column in data
-            else pd.Series(dtype=float)
+            np.asarray(data.arrays[acceleration_inner_column], dtype=np.float64) if use_inner else np.empty(0)
         )
         acceleration_drag_shield = (
-            data[acceleration_drag_column] if use_drag and acceleration_drag_column in data else pd.Series(dtype=float)
+            np.asarray(data.arrays[acceleration_drag_column], dtype=np.float64) if use_drag else np.empty(0)
         )
 
-        # Inner加速度計の上下反転補正
-        if use_inner and config.get("invert_inner_acceleration", False):
-            logger.info("Inner加速度計の上下反転補正を適用します")
-            acceleration_inner_capsule = -acceleration_inner_capsule
+        logger.debug("加速度閾値: %s", acceleration_threshold)
 
-        # 加速度の閾値（デフォルト1m/s^2）を設定
-        acceleration_threshold = config.get("acceleration_threshold", 1.0)
-        logger.debug(f"加速度閾値: {acceleration_threshold}")
+        # 配列ごとの除算を避けるため、重力定数の逆数を掛けて重力レベルに変換する
+        inverse_gravity = 1.0 / gravity_constant
+        inner_scale = inverse_gravity
 
-        # Drag ShieldとInner Capsuleの同期点を見つける
-        sync_indices_drag = (
-            np.where(np.abs(acceleration_drag_shield) < acceleration_threshold)[0]
-            if use_drag and not acceleration_drag_shield.empty
-            else np.array([])
-        )
-        sync_indices_inner = (
-            np.where(np.abs(acceleration_inner_capsule) < acceleration_threshold)[0]
-            if use_inner and not acceleration_inner_capsule.empty
-            else np.array([])
+        # Inner加速度計の上下反転補正（変換時の係数の符号に含める）
+        if use_inner and invert_inner:
+            logger.info("Inner加速度計の上下反転補正を適用します")
+            inner_scale = -inverse_gravity
+
+        # Drag ShieldとInner Capsuleの同期点（閾値を下回る最初のサンプル）の検出と重力レベルへの変換
+        found_sync_drag, gravity_level_drag_values = (
+            _scan_and_normalize(acceleration_drag_shield, acceleration_threshold, inverse_gravity, gravity_dtype)
+            if use_drag
+            else (-1, acceleration_drag_shield)
         )
-        logger.debug(
-            f"Drag Shield同期点候補数: {len(sync_indices_drag)}, Inner Capsule同期点候補数: {len(sync_indices_inner)}"
+        found_sync_inner, gravity_level_inner_values = (
+            _scan_and_normalize(acceleration_inner_capsule, acceleration_threshold, inner_scale, gravity_dtype)
+            if use_inner
+            else (-1, acceleration_inner_capsule)
         )
+        logger.debug("Drag Shield同期点: %s, Inner Capsule同期点: %s", found_sync_drag, found_sync_inner)
 
         if len(time) == 0:
             raise DataProcessingError("時間データが空です。CSVの内容を確認してください。")
 
         # 同期点は可能な限り検出し、検出できない場合は先頭を使用する
-        sync_index_drag = int(sync_indices_drag[0]) if len(sync_indices_drag) > 0 else 0
-        sync_index_inner = int(sync_indices_inner[0]) if len(sync_indices_inner) > 0 else 0
+        sync_index_drag = max(found_sync_drag, 0)
+        sync_index_inner = max(found_sync_inner, 0)
 
-        if use_drag and len(sync_indices_drag) == 0:
+        if use_drag and found_sync_drag < 0:
             logger.warning("Drag Shieldの同期点が見つからず、先頭サンプルを同期点として使用します")
-        if use_inner and len(sync_indices_inner) == 0 and len(sync_indices_drag) > 0:
+        if use_inner and found_sync_inner < 0 and found_sync_drag >= 0:
             sync_index_inner = sync_index_drag
             logger.info("Inner Capsuleの同期点が見つからなかったため、Drag Shieldの同期点を流用します")
-        elif use_inner and len(sync_indices_inner) == 0:
+        elif use_inner and found_sync_inner < 0:
             logger.warning("Inner Capsuleの同期点が見つからず、先頭サンプルを同期点として使用します")
 
-        logger.info(f"同期点を検出: inner_index={sync_index_inner}, drag_index={sync_index_drag}")
+        logger.info("同期点を検出: inner_index=%s, drag_index=%s", sync_index_inner, sync_index_drag)
 
-        # 各系列の時間を同期点基準で調整（利用しない系列は空を返す）
-        adjusted_time_inner = pd.Series(time - time.iloc[sync_index_inner]) if use_inner else pd.Series(dtype=float)
-        adjusted_time_drag = pd.Series(time - time.iloc[sync_index_drag]) if use_drag else pd.Series(dtype=float)
-
-        gravity_constant = config["gravity_constant"]
-        if gravity_constant == 0:
-            raise DataProcessingError("重力定数が0に設定されています。設定を確認してください。")
+        # 処理結果のサンプル値をログに記録
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "重力レベル計算 (先頭5件): inner_capsule=%s, drag_shield=%s",
+                gravity_level_inner_values[:5].tolist(),
+                gravity_level_drag_values[:5].tolist(),
+            )
 
+        # 各系列の時間を同期点基準で調整し、重力レベルに変換してSeriesとして返す（利用しない系列は空を返す）
+        # 計算済みの配列はコピーせずにSeriesで包む
+        index = pd.RangeIndex(data.length)
+        adjusted_time_inner = (
+            pd.Series(np.subtract(time, time[sync_index_inner]), index=index, name=time_column, copy=False)
+            if use_inner
+            else pd.Series(dtype=float)
+        )
+        if use_drag and use_inner and sync_index_drag == sync_index_inner:
+            # 同期点が同じ場合は調整済み時間も同じになるため、両系列で1つの配列を共有する
+            # （共有した配列は読み取り専用にし、一方の変更が他方に波及しないようにする）
+            shared_time = adjusted_time_inner.to_numpy()
+            shared_time.flags.writeable = False
+            adjusted_time_drag = pd.Series(shared_time, index=index, name=time_column, copy=False)
+        elif use_drag:
+            adjusted_time_drag = pd.Series(
+                np.subtract(time, time[sync_index_drag]), index=index, name=time_column, copy=False
+            )
+        else:
+            adjusted_time_drag = pd.Series(dtype=float)
         gravity_level_inner_capsule = (
-            acceleration_inner_capsule / gravity_constant if use_inner else pd.Series(dtype=float)
+            pd.Series(gravity_level_inner_values, index=index, name=acceleration_inner_column, copy=False)
+            if use_inner
+            else pd.Series(dtype=float)
         )
-        gravity_level_drag_shield = acceleration_drag_shield / gravity_constant if use_drag else pd.Series(dtype=float)
-
-        # 処理結果のサンプル値をログに記録
-        logger.debug(
-            f"重力レベル計算 (先頭5件): inner_capsule={gravity_level_inner_capsule.head(5).tolist()}, "
-            f"drag_shield={gravity_level_drag_shield.head(5).tolist()}"
+        gravity_level_drag_shield = (
+            pd.Series(gravity_level_drag_values, index=index, name=acceleration_drag_column, copy=False)
+            if use_drag
+            else pd.Series(dtype=float)
         )
 
         # 調整済み時間を返却（inner, drag）
@@ -228,7 +446,59 @@ def load_and_process_data(file_path: str, config: dict[str, Any]) -> tuple[pd.Se
         raise DataLoadError(file_path, "データの読み込みに失敗しました", e) from e
 
 
-def _find_start_indices(time: pd.Series | None, adjusted_time: pd.Series | None) -> tuple[int, int]:
+def _stream_start_index(time_values: np.ndarray, label: str) -> int:
+    """時間が0以上になる最初のインデックスを返す（見つからない場合は0）"""
+    start_index = _first_index(time_values, lambda block: block >= 0)
+    if start_index < 0:
+        logger.warning("%sの開始点が見つかりませんでした。最初のインデックスを使用します。", label)
+        start_index = 0
+    return start_index
+
+
+def _stream_end_index(gravity_values: np.ndarray, min_index: int, end_gravity_level: float, label: str) -> int:
+    """最小インデックス以降で重力レベルが終了閾値以上になる最初のインデックスを返す（見つからない場合は末尾）"""
+    end_index = _first_index(gravity_values, lambda block: block >= end_gravity_level, min_index)
+    if end_index >= 0:
+        logger.debug("%sの終了インデックス: %s", label, end_index)
+    else:
+        end_index = len(gravity_values) - 1
+        logger.warning("%sの終了点が見つからず、データの最後を使用: %s", label, end_index)
+    return end_index
+
+
+def _stream_bounds(
+    time_values: np.ndarray,
+    gravity_values: np.ndarray,
+    min_seconds_after_start: float,
+    end_gravity_level: float,
+    label: str,
+) -> tuple[int, int, int]:
+    """
+    1系列分の開始・最小時間・終了インデックスを検出する
+
+    各探索は前の探索で見つかった位置から始める。開始点より前の時間は負のため、
+    min_seconds_after_startが0以上であれば最小時間点の探索も開始点から始めてよい。
+
+    Returns:
+        開始インデックス、最小時間インデックス、終了インデックス
+    """
+    start_index = _stream_start_index(time_values, label)
+
+    min_time = time_values[start_index] + min_seconds_after_start
+    search_from = start_index if min_seconds_after_start >= 0 else 0
+    min_index = _first_index(time_values, lambda block: block >= min_time, search_from)
+    if min_index < 0:
+        logger.warning("%sの最小時間点が見つかりませんでした。開始インデックスを使用します。", label)
+        min_index = start_index
+    logger.debug("%sの最小時間インデックス: %s, 時間: %s", label, min_index, time_values[min_index])
+
+    end_index = _stream_end_index(gravity_values, min_index, end_gravity_level, label)
+    return start_index, min_index, end_index
+
+
+def _find_start_indices(
+    time: pd.Series | np.ndarray | None, adjusted_time: pd.Series | np.ndarray | None
+) -> tuple[int, int]:
     """
     時間データから開始インデックスを検出する
 
@@ -240,24 +510,14 @@ def _find_start_indices(time: pd.Series | None, adjusted_time: pd.Series | None)
         Inner CapsuleとDrag Shieldの開始インデックス
     """
     # 開始点は0秒から - インデックスエラーを防止するためのチェックを追加
-    if time is not None and not time.empty:
-        start_indices_inner = np.where(time >= 0)[0]
-        if len(start_indices_inner) > 0:
-            start_index_inner = int(start_indices_inner[0])
-        else:
-            logger.warning("Inner capsuleの開始点が見つかりませんでした。最初のインデックスを使用します。")
-            start_index_inner = 0
+    if time is not None and len(time) > 0:
+        start_index_inner = _stream_start_index(np.asarray(time), "Inner capsule")
     else:
         start_index_inner = 0
         logger.debug("Inner capsuleの時間データが空のため開始インデックスを0に設定します。")
 
-    if adjusted_time is not None and not adjusted_time.empty:
-        start_indices_drag = np.where(adjusted_time >= 0)[0]
-        if len(start_indices_drag) > 0:
-            start_index_drag = int(start_indices_drag[0])
-        else:
-            logger.warning("Drag shieldの開始点が見つかりませんでした。最初のインデックスを使用します。")
-            start_index_drag = 0
+    if adjusted_time is not None and len(adjusted_time) > 0:
+        start_index_drag = _stream_start_index(np.asarray(adjusted_time), "Drag shield")
     else:
         start_index_drag = 0
         logger.debug("Drag shieldの調整時間データが空のため開始インデックスを0に設定します。")
@@ -266,8 +526,8 @@ def _find_start_indices(time: pd.Series | None, adjusted_time: pd.Series | None)
 
 
 def _find_end_indices(
-    gravity_level_inner_capsule: pd.Series | None,
-    gravity_level_drag_shield: pd.Series | None,
+    gravity_level_inner_capsule: pd.Series | np.ndarray | None,
+    gravity_level_drag_shield: pd.Series | np.ndarray | None,
     min_index_inner: int,
     min_index_drag: int,
     end_gravity_level: float,
@@ -286,28 +546,18 @@ def _find_end_indices(
         Inner CapsuleとDrag Shieldの終了インデックス
     """
     # 最小インデックス以降で終了インデックスを計算
-    if gravity_level_inner_capsule is not None and not gravity_level_inner_capsule.empty:
-        end_index_inner_candidates = np.where(gravity_level_inner_capsule >= end_gravity_level)[0]
-        end_index_inner_candidates = np.array([i for i in end_index_inner_candidates if i >= min_index_inner])
-        if len(end_index_inner_candidates) > 0:
-            end_index_inner = int(end_index_inner_candidates[0])
-            logger.debug(f"Inner capsuleの終了インデックス: {end_index_inner}")
-        else:
-            end_index_inner = len(gravity_level_inner_capsule) - 1
-            logger.warning(f"Inner capsuleの終了点が見つからず、データの最後を使用: {end_index_inner}")
+    if gravity_level_inner_capsule is not None and len(gravity_level_inner_capsule) > 0:
+        end_index_inner = _stream_end_index(
+            np.asarray(gravity_level_inner_capsule), min_index_inner, end_gravity_level, "Inner capsule"
+        )
     else:
         end_index_inner = -1
         logger.debug("Inner capsuleの重力データがないため終了インデックスは-1になります。")
 
-    if gravity_level_drag_shield is not None and not gravity_level_drag_shield.empty:
-        end_index_drag_candidates = np.where(gravity_level_drag_shield >= end_gravity_level)[0]
-        end_index_drag_candidates = np.array([i for i in end_index_drag_candidates if i >= min_index_drag])
-        if len(end_index_drag_candidates) > 0:
-            end_index_drag = int(end_index_drag_candidates[0])
-            logger.debug(f"Drag shieldの終了インデックス: {end_index_drag}")
-        else:
-            end_index_drag = len(gravity_level_drag_shield) - 1
-            logger.warning(f"Drag shieldの終了点が見つからず、データの最後を使用: {end_index_drag}")
+    if gravity_level_drag_shield is not None and len(gravity_level_drag_shield) > 0:
+        end_index_drag = _stream_end_index(
+            np.asarray(gravity_level_drag_shield), min_index_drag, end_gravity_level, "Drag shield"
+        )
     else:
         end_index_drag = -1
         logger.debug("Drag shieldの重力データがないため終了インデックスは-1になります。")
@@ -316,10 +566,10 @@ def _find_end_indices(
 
 
 def filter_data(
-    time: pd.Series,
-    gravity_level_inner_capsule: pd.Series,
-    gravity_level_drag_shield: pd.Series,
-    adjusted_time: pd.Series,
+    time: pd.Series | np.ndarray,
+    gravity_level_inner_capsule: pd.Series | np.ndarray,
+    gravity_level_drag_shield: pd.Series | np.ndarray,
+    adjusted_time: pd.Series | np.ndarray,
     config: dict[str, Any],
 ) -> tuple[pd.Series, pd.Series, pd.Series, pd.Series, int]:
     """
@@ -330,10 +580,10 @@ def filter_data(
     独立してフィルタリングされます。
 
     Args:
-        time (pandas.Series): 時間データ
-        gravity_level_inner_capsule (pandas.Series): Inner Capsuleの重力レベル
-        gravity_level_drag_shield (pandas.Series): Drag Shieldの重力レベル
-        adjusted_time (pandas.Series): 調整された時間データ
+        time (pandas.Series | numpy.ndarray): 時間データ
+        gravity_level_inner_capsule (pandas.Series | numpy.ndarray): Inner Capsuleの重力レベル
+        gravity_level_drag_shield (pandas.Series | numpy.ndarray): Drag Shieldの重力レベル
+        adjusted_time (pandas.Series | numpy.ndarray): 調整された時間データ
         config (dict): 設定情報
 
     Returns:
@@ -346,6 +596,16 @@ def filter_data(
     """
     logger.info("データのフィルタリングを開始")
 
+    # 設定値はまとめて取得する
+    min_seconds_after_start = config.get("min_seconds_after_start", 0.0)
+    required_min_length = config.get("sampling_rate", 1000) * config.get("window_size", 0.1)
+
+    # NumPy配列で渡された場合もSeriesとして扱う
+    time, gravity_level_inner_capsule, gravity_level_drag_shield, adjusted_time = (
+        pd.Series(values, dtype=np.float64) if isinstance(values, np.ndarray) else values
+        for values in (time, gravity_level_inner_capsule, gravity_level_drag_shield, adjusted_time)
+    )
+
     has_inner = gravity_level_inner_capsule is not None and not gravity_level_inner_capsule.empty
     has_drag = gravity_level_drag_shield is not None and not gravity_level_drag_shield.empty
 
@@ -359,96 +619,67 @@ def filter_data(
         raise DataProcessingError("Inner Capsule/Drag Shieldの加速度データが見つかりませんでした。")
 
     logger.info(
-        f"データサイズ: inner_capsule={len(gravity_level_inner_capsule)}, "
-        f"drag_shield={len(gravity_level_drag_shield)}, "
-        f"time={len(time)}, adjusted_time={len(adjusted_time)}"
+        "データサイズ: inner_capsule=%s, drag_shield=%s, time=%s, adjusted_time=%s",
+        len(gravity_level_inner_capsule),
+        len(gravity_level_drag_shield),
+        len(time),
+        len(adjusted_time),
     )
 
     # データが不足している場合の警告
-    required_min_length = config.get("sampling_rate", 1000) * config.get("window_size", 0.1)
     min_data_length = min(data_lengths)
     if min_data_length < required_min_length:
         logger.warning(
-            f"データ長が不足しています。最小データ長: {min_data_length}, 必要な最小長: {required_min_length}"
+            "データ長が不足しています。最小データ長: %s, 必要な最小長: %s", min_data_length, required_min_length
         )
 
     try:
-        # 開始インデックスを検出
-        start_index_inner, start_index_drag = _find_start_indices(
-            time if has_inner else None, adjusted_time if has_drag else None
-        )
-        logger.debug(f"開始インデックス: inner={start_index_inner}, drag={start_index_drag}")
-
-        # 開始点からの最小秒数を取得
-        min_seconds_after_start = config.get("min_seconds_after_start", 0.0)
-        logger.debug(f"開始点からの最小秒数: {min_seconds_after_start}")
-
-        # Inner capsuleのデータで、開始点からmin_seconds_after_start秒後以降のインデックスを計算
-        if has_inner:
-            min_time_inner = time.iloc[start_index_inner] + min_seconds_after_start
-            min_indices_inner = np.where(time >= min_time_inner)[0]
-            if len(min_indices_inner) > 0:
-                min_index_inner = int(min_indices_inner[0])
-            else:
-                logger.warning("Inner capsuleの最小時間点が見つかりませんでした。開始インデックスを使用します。")
-                min_index_inner = start_index_inner
-            logger.debug(f"Inner capsuleの最小時間インデックス: {min_index_inner}, 時間: {time.iloc[min_index_inner]}")
-        else:
-            min_index_inner = start_index_inner
-            logger.debug("Inner capsuleデータがないため最小時間インデックスは開始インデックスを使用します。")
-
-        # Drag shieldのデータで、開始点からmin_seconds_after_start秒後以降のインデックスを計算
-        if has_drag:
-            min_time_drag = adjusted_time.iloc[start_index_drag] + min_seconds_after_start
-            min_indices_drag = np.where(adjusted_time >= min_time_drag)[0]
-            if len(min_indices_drag) > 0:
-                min_index_drag = int(min_indices_drag[0])
-            else:
-                logger.warning("Drag shieldの最小時間点が見つかりませんでした。開始インデックスを使用します。")
-                min_index_drag = start_index_drag
-            logger.debug(
-                f"Drag shieldの最小時間インデックス: {min_index_drag}, 時間: {adjusted_time.iloc[min_index_drag]}"
-            )
-        else:
-            min_index_drag = start_index_drag
-            logger.debug("Drag shieldデータがないため最小時間インデックスは開始インデックスを使用します。")
-
-        # 終了インデックスを検出
-        end_index_inner, end_index_drag = _find_end_indices(
-            gravity_level_inner_capsule if has_inner else None,
-            gravity_level_drag_shield if has_drag else None,
-            min_index_inner,
-            min_index_drag,
-            config["end_gravity_level"],
-        )
+        end_gravity_level = config["end_gravity_level"]
 
-        # データセットごとに個別にフィルタリング
-        filtered_time = (
-            time[start_index_inner : end_index_inner + 1]
-            if has_inner and end_index_inner >= start_index_inner
-            else pd.Series(dtype=float)
-        )
-        filtered_gravity_level_inner_capsule = (
-            gravity_level_inner_capsule[start_index_inner : end_index_inner + 1]
-            if has_inner and end_index_inner >= start_index_inner
-            else pd.Series(dtype=float)
-        )
+        # インデックスの探索はpandasを介さずNumPy配列で行い、Seriesは最後のスライスにだけ使う
+        time_values = time.to_numpy(np.float64, copy=False) if has_inner else None
+        adjusted_time_values = adjusted_time.to_numpy(np.float64, copy=False) if has_drag else None
+        gravity_inner_values = gravity_level_inner_capsule.to_numpy(copy=False) if has_inner else None
+        gravity_drag_values = gravity_level_drag_shield.to_numpy(copy=False) if has_drag else None
 
-        filtered_adjusted_time = (
-            adjusted_time[start_index_drag : end_index_drag + 1]
-            if has_drag and end_index_drag >= start_index_drag
-            else pd.Series(dtype=float)
+        logger.debug("開始点からの最小秒数: %s", min_seconds_after_start)
+
+        # 系列ごとに開始・最小時間・終了インデックスを検出（利用しない系列は開始0・終了-1）
+        start_index_inner, _, end_index_inner = (
+            _stream_bounds(
+                time_values, gravity_inner_values, min_seconds_after_start, end_gravity_level, "Inner capsule"
+            )
+            if has_inner
+            else (0, 0, -1)
         )
-        filtered_gravity_level_drag_shield = (
-            gravity_level_drag_shield[start_index_drag : end_index_drag + 1]
-            if has_drag and end_index_drag >= start_index_drag
-            else pd.Series(dtype=float)
+        start_index_drag, _, end_index_drag = (
+            _stream_bounds(
+                adjusted_time_values, gravity_drag_values, min_seconds_after_start, end_gravity_level, "Drag shield"
+            )
+            if has_drag
+            else (0, 0, -1)
         )
+        logger.debug("開始インデックス: inner=%s, drag=%s", start_index_inner, start_index_drag)
+
+        # データセットごとに個別にフィルタリング（位置ベースのスライスで、無効な系列は空のSeriesを返す）
+        streams = {
+            "inner": (time, gravity_level_inner_capsule, start_index_inner, end_index_inner, has_inner),
+            "drag": (adjusted_time, gravity_level_drag_shield, start_index_drag, end_index_drag, has_drag),
+        }
+        filtered: dict[str, tuple[pd.Series, pd.Series]] = {}
+        for name, (stream_time, stream_gravity, start, end, available) in streams.items():
+            if available and end >= start:
+                filtered[name] = (stream_time.iloc[start : end + 1], stream_gravity.iloc[start : end + 1])
+            else:
+                filtered[name] = (pd.Series(dtype=np.float64), pd.Series(dtype=np.float64))
+        filtered_time, filtered_gravity_level_inner_capsule = filtered["inner"]
+        filtered_adjusted_time, filtered_gravity_level_drag_shield = filtered["drag"]
 
         # データサイズをログに記録
         logger.debug(
-            f"フィルタリング結果のサイズ: inner={len(filtered_gravity_level_inner_capsule)}, "
-            f"drag={len(filtered_gravity_level_drag_shield)}"
+            "フィルタリング結果のサイズ: inner=%s, drag=%s",
+            len(filtered_gravity_level_inner_capsule),
+            len(filtered_gravity_level_drag_shield),
         )
 
         # 統計情報の計算のために全体の終了インデックスを保持
@@ -8,6 +8,9 @@
 
 from __future__ import annotations
 
+import logging
+import math
+import os
 import shutil
 from collections.abc import Callable
 from pathlib import Path
@@ -16,11 +19,11 @@ from typing import Any
 import numpy as np
 import pandas as pd
 from openpyxl import Workbook, load_workbook
-from openpyxl.utils.dataframe import dataframe_to_rows
 
+from core.data_processor import find_sync_index
 from core.exceptions import ExportError
 from core.logger import get_logger, log_exception
-from core.paths import ensure_graphs_dir, ensure_results_dir
+from core.paths import ensure_graphs_dir
 
 # モジュール用のロガーを初期化
 logger = get_logger("export")
@@ -28,6 +31,20 @@ logger = get_logger("export")
 ConfirmHandler = Callable[[Path], bool]
 NotifyHandler = Callable[[str], None]
 
+# G-quality Analysis シートの列見出し（g_quality_data の各タプルの並びに対応）
+_G_QUALITY_COLUMNS = (
+    "Window Size (s)",
+    "Inner Capsule: Time at smallest Standard Deviation(s)",
+    "Inner Capsule: Mean Gravity Level of the interval with the smallest standard deviation(G)",
+    "Inner Capsule: smallest Standard Deviation(G)",
+    "Drag Shield: Time at smallest Standard Deviation(s)",
+    "Drag Shield: Mean Gravity Level of the interval with the smallest standard deviation(G)",
+    "Drag Shield: smallest Standard Deviation(G)",
+)
+
+# 補間先が補間元の何倍を超えたら、補間元側からの走査で添字を求めるか
+_MONOTONE_SCAN_RATIO = 4
+
 
 def _default_confirm_overwrite(path: Path) -> bool:
     logger.warning("上書き確認のハンドラが指定されていないため自動的に上書きします: %s", path)
@@ -42,6 +59,130 @@ def _default_notify_info(message: str) -> None:
     logger.info(message)
 
 
+def _is_same_grid(unified_time: np.ndarray, xp: np.ndarray) -> bool:
+    """補間元の時刻列が補間先の時間軸と（刻み幅の1e-6倍の誤差内で）一致するかを返す"""
+    if xp.shape != unified_time.shape or unified_time.size < 2:
+        return False
+    tolerance = abs(unified_time[1] - unified_time[0]) * 1e-6
+    if abs(xp[0] - unified_time[0]) > tolerance or abs(xp[-1] - unified_time[-1]) > tolerance:
+        return False
+    return bool(np.allclose(xp, unified_time, rtol=0.0, atol=tolerance))
+
+
+def _interp_shared(unified_time: np.ndarray, xp: Any, ys: list[Any]) -> list[np.ndarray]:
+    """
+    同じ x 軸を持つ複数の系列を、探索インデックスを共有して線形補間する
+
+    `np.interp` と同様に範囲外は端点の値で埋めますが、`searchsorted` は 1 回だけ実行します。
+
+    Args:
+        unified_time (numpy.ndarray): 補間先の時間軸（昇順）
+        xp (array-like): 補間元の時間軸（昇順）
+        ys (list): `xp` と同じ長さの補間元データのリスト
+
+    Returns:
+        list[numpy.ndarray]: `ys` と同じ順序の補間結果
+    """
+    xp_values = np.asarray(xp, dtype=np.float64)
+    y_values = [np.asarray(y, dtype=np.float64) for y in ys]
+    if xp_values.size == 0:
+        raise ValueError("補間元の時間軸が空です。")
+    if any(y.shape != xp_values.shape for y in y_values):
+        raise ValueError("補間元の時間軸とデータの長さが一致しません。")
+    if xp_values.size == 1:
+        return [np.full(unified_time.shape, y[0]) for y in y_values]
+    if _is_same_grid(unified_time, xp_values):
+        # 補間元が補間先と同じ時刻列であれば補間せずにそのまま使う
+        return y_values
+
+    if unified_time.size > _MONOTONE_SCAN_RATIO * xp_values.size:
+        # 補間先の方が十分に長い場合は、xp 側の境界位置だけを探索して累積和で添字を展開する
+        boundaries = np.searchsorted(unified_time, xp_values, side="left")
+        idx = np.cumsum(np.bincount(boundaries, minlength=unified_time.size + 1)[: unified_time.size]) - 1
+    else:
+        idx = np.searchsorted(xp_values, unified_time, side="right") - 1
+    np.clip(idx, 0, xp_values.size - 2, out=idx)
+    x0 = xp_values[idx]
+    dx = xp_values[idx + 1] - x0
+    weight = np.divide(unified_time - x0, dx, out=np.zeros_like(dx), where=dx > 0)
+    np.clip(weight, 0.0, 1.0, out=weight)
+    return [y[idx] + weight * (y[idx + 1] - y[idx]) for y in y_values]
+
+
+def _interp_columns(unified_time: np.ndarray, sources: list[tuple[str, Any, Any]]) -> dict[str, np.ndarray]:
+    """
+    (列名, x 軸, データ) の組を x 軸ごとにまとめて補間する
+
+    同じ x 軸を持つ列は `_interp_shared` の 1 回の呼び出しで処理します。
+    """
+    groups: list[tuple[np.ndarray, list[str], list[Any]]] = []
+    for name, xp, y in sources:
+        xp_values = np.asarray(xp, dtype=np.float64)
+        for group_xp, names, ys in groups:
+            if group_xp is xp_values or np.array_equal(group_xp, xp_values):
+                names.append(name)
+                ys.append(y)
+                break
+        else:
+            groups.append((xp_values, [name], [y]))
+
+    columns: dict[str, np.ndarray] = {}
+    for group_xp, names, ys in groups:
+        columns.update(zip(names, _interp_shared(unified_time, group_xp, ys), strict=True))
+    return {name: columns[name] for name, _, _ in sources}
+
+
+def _write_columns(workbook: Workbook, sheet_name: str, columns: dict[str, np.ndarray]) -> None:
+    """
+    列ごとの配列をDataFrameを介さずにシートへ書き込む
+
+    pandasのExcelフォーマッタを経由せず、行単位でそのまま追記します。
+    NaNと±infは空セルとして出力します（Excelは非有限値を数値として扱えないため）。
+
+    Args:
+        workbook (openpyxl.Workbook): 書き込み先のWorkbook
+        sheet_name (str): 作成するシート名
+        columns (dict): 列名をキー、同じ長さの数値配列を値とする辞書
+    """
+    sheet = workbook.create_sheet(title=sheet_name)
+    sheet.append(list(columns))
+    if not columns:
+        return
+
+    # 行単位で追記するため、行方向に連続した2次元配列へ一度だけ詰めてから変換する
+    n_rows = len(next(iter(columns.values())))
+    block = np.empty((n_rows, len(columns)), dtype=np.float64)
+    for index, column in enumerate(columns.values()):
+        block[:, index] = column
+    rows = block.tolist()
+    non_finite = ~np.isfinite(block)
+    for row_index in np.flatnonzero(non_finite.any(axis=1)):
+        rows[row_index] = [cell if math.isfinite(cell) else None for cell in rows[row_index]]
+    for row in rows:
+        sheet.append(row)
+
+
+def _cell_value(value: Any) -> Any:
+    """欠損値と非有限の数値（NaN・±inf）を空セル（None）に置き換える"""
+    if pd.isna(value) or (isinstance(value, (float, np.floating)) and not math.isfinite(value)):
+        return None
+    return value
+
+
+def _next_numbered_path(directory: Path, base_name: str, suffix: str) -> Path:
+    """
+    `<base_name>_<連番><suffix>` のうち、まだ存在しない最小の連番のパスを返す
+
+    連番ごとに存在確認を行わず、ディレクトリを1回だけ走査して既存のファイル名から求めます。
+    """
+    with os.scandir(directory) as entries:
+        existing = {entry.name for entry in entries}
+    counter = 1
+    while f"{base_name}_{counter}{suffix}" in existing:
+        counter += 1
+    return directory / f"{base_name}_{counter}{suffix}"
+
+
 def create_output_directories(csv_dir: str | None = None) -> tuple[Path, Path]:
     """
     出力用ディレクトリ構造を作成する
@@ -57,8 +198,9 @@ def create_output_directories(csv_dir: str | None = None) -> tuple[Path, Path]:
     """
     logger.debug("create_output_directories called with csv_dir: %s", csv_dir)
 
-    results_dir = ensure_results_dir(csv_dir)
+    # ensure_graphs_dir が results_AAT も作成するため、パスの解決とmkdirは1回で済ませる
     graphs_dir = ensure_graphs_dir(csv_dir)
+    results_dir = graphs_dir.parent
 
     logger.debug("Created directories: results=%s, graphs=%s", results_dir, graphs_dir)
 
@@ -140,16 +282,13 @@ def export_data(
     if graph_path is not None:
         graph_path_obj = Path(graph_path)
         if graph_path_obj.exists() and graph_path_obj != new_graph_path:
-            shutil.copy2(graph_path, new_graph_path)
+            shutil.copyfile(graph_path, new_graph_path)
 
     # 既存ファイルの確認
     if output_file_path.exists():
         if not confirm_overwrite(output_file_path):
             # 新しいファイル名を生成（連番を付加）
-            counter = 1
-            while (results_dir / f"{base_name}_{counter}.xlsx").exists():
-                counter += 1
-            output_file_path = results_dir / f"{base_name}_{counter}.xlsx"
+            output_file_path = _next_numbered_path(results_dir, base_name, ".xlsx")
             notify_info(f"ファイル名を変更して保存します: {output_file_path.name}")
 
     try:
@@ -181,55 +320,46 @@ def export_data(
             raise ValueError("サンプリングレートは正の数でなければなりません。")
         time_step = 1.0 / sampling_rate
 
-        # 共通の時間軸を生成
-        unified_time = np.arange(start_time, end_time + time_step, time_step)
+        # 共通の時間軸を生成（終了時刻を含む点数を整数で決めてから刻むため、丸め誤差で点数が揺れない）
+        n_samples = int(np.ceil((end_time - start_time) * sampling_rate - 1e-9)) + 1
+        unified_time = start_time + np.arange(n_samples) * time_step
 
-        # データフレームの作成（統一された時間軸）
-        export_columns = {"Time (s)": unified_time}
+        # 出力する列の作成（統一された時間軸）
+        gravity_sources = []
         if (
             time is not None
             and not time.empty
             and gravity_level_inner_capsule is not None
             and not gravity_level_inner_capsule.empty
         ):
-            export_columns["Gravity Level (Inner Capsule) (G)"] = np.interp(
-                unified_time, time, gravity_level_inner_capsule
-            )
+            gravity_sources.append(("Gravity Level (Inner Capsule) (G)", time, gravity_level_inner_capsule))
         if (
             adjusted_time is not None
             and not adjusted_time.empty
             and gravity_level_drag_shield is not None
             and not gravity_level_drag_shield.empty
         ):
-            export_columns["Gravity Level (Drag Shield) (G)"] = np.interp(
-                unified_time, adjusted_time, gravity_level_drag_shield
-            )
-        export_data = pd.DataFrame(export_columns)
-
-        # 統計情報のデータフレームを作成
-        stats_df = pd.DataFrame(
-            {
-                "Statistic": [
-                    "Inner Capsule: Mean Gravity Level of the interval with the smallest standard deviation(G)",
-                    "Inner Capsule: Time at smallest Standard Deviation(s)",
-                    "Inner Capsule: smallest Standard Deviation(G)",
-                    "Drag Shield: Mean Gravity Level of the interval with the smallest standard deviation(G)",
-                    "Drag Shield: Time at smallest Standard Deviation(s)",
-                    "Drag Shield: smallest Standard Deviation(G)",
-                ],
-                "Value": [
-                    min_mean_inner_capsule,
-                    min_time_inner_capsule,
-                    min_std_inner_capsule,
-                    min_mean_drag_shield,
-                    min_time_drag_shield,
-                    min_std_drag_shield,
-                ],
-            }
-        )
+            gravity_sources.append(("Gravity Level (Drag Shield) (G)", adjusted_time, gravity_level_drag_shield))
+        export_columns = {"Time (s)": unified_time, **_interp_columns(unified_time, gravity_sources)}
+
+        # 統計情報の行を作成
+        stats_rows = [
+            (
+                "Inner Capsule: Mean Gravity Level of the interval with the smallest standard deviation(G)",
+                min_mean_inner_capsule,
+            ),
+            ("Inner Capsule: Time at smallest Standard Deviation(s)", min_time_inner_capsule),
+            ("Inner Capsule: smallest Standard Deviation(G)", min_std_inner_capsule),
+            (
+                "Drag Shield: Mean Gravity Level of the interval with the smallest standard deviation(G)",
+                min_mean_drag_shield,
+            ),
+            ("Drag Shield: Time at smallest Standard Deviation(s)", min_time_drag_shield),
+            ("Drag Shield: smallest Standard Deviation(G)", min_std_drag_shield),
+        ]
 
         # トリミング範囲の加速度データを準備
-        acceleration_data = None
+        acceleration_data: dict[str, np.ndarray] | None = None
         if raw_data is not None:
             # 元のCSVデータが提供されている場合
             try:
@@ -241,11 +371,15 @@ def export_data(
                 use_drag = config.get("use_drag_acceleration", True)
 
                 logger.info(
-                    "加速度データの処理開始: "
-                    f"時間列={time_column}, 内カプセル加速度列={acceleration_inner_column}, 外カプセル加速度列={acceleration_drag_column}, "
-                    f"_inner使用={use_inner}, _drag使用={use_drag}"
+                    "加速度データの処理開始: 時間列=%s, 内カプセル加速度列=%s, 外カプセル加速度列=%s, _inner使用=%s, _drag使用=%s",
+                    time_column,
+                    acceleration_inner_column,
+                    acceleration_drag_column,
+                    use_inner,
+                    use_drag,
                 )
-                logger.debug(f"元データの列: {raw_data.columns.tolist()}")
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("元データの列: %s", raw_data.columns.tolist())
 
                 if time_column is None:
                     notify_warning("加速度データの時間列が設定されていないため、エクスポートをスキップします。")
@@ -264,7 +398,7 @@ def export_data(
                         missing_cols.append(f"外カプセル加速度列({acceleration_drag_column})")
 
                     if not raw_columns_valid and missing_cols:
-                        logger.warning(f"必要な列が見つかりません: {missing_cols}")
+                        logger.warning("必要な列が見つかりません: %s", missing_cols)
                         notify_warning(
                             "必要な列が見つかりません: "
                             f"\n{', '.join(missing_cols)}\n\n"
@@ -274,13 +408,17 @@ def export_data(
 
                 if raw_columns_valid:
                     try:
-                        orig_time_data = raw_data[time_column].values.astype(float)
+                        orig_time_data = raw_data[time_column].to_numpy(dtype=np.float64, copy=False)
                         acceleration_columns: dict[str, np.ndarray] = {}
 
                         if use_inner and acceleration_inner_column:
-                            acceleration_columns["inner"] = raw_data[acceleration_inner_column].values.astype(float)
+                            acceleration_columns["inner"] = raw_data[acceleration_inner_column].to_numpy(
+                                dtype=np.float64, copy=False
+                            )
                         if use_drag and acceleration_drag_column:
-                            acceleration_columns["drag"] = raw_data[acceleration_drag_column].values.astype(float)
+                            acceleration_columns["drag"] = raw_data[acceleration_drag_column].to_numpy(
+                                dtype=np.float64, copy=False
+                            )
 
                         if not acceleration_columns:
                             logger.info(
@@ -290,25 +428,30 @@ def export_data(
                             orig_adjusted_time = orig_time_data
                             if "drag" in acceleration_columns:
                                 acc_thresh = config.get("acceleration_threshold", 1.0)
-                                sync_mask = np.abs(acceleration_columns["drag"]) < acc_thresh
-                                if sync_mask.any():
-                                    sync_idx = np.where(sync_mask)[0][0]
-                                    orig_adjusted_time = orig_time_data - orig_time_data[sync_idx]
-                                else:
-                                    orig_adjusted_time = orig_time_data - orig_time_data[0]
-
-                            accel_frame = {"Time (s)": unified_time}
+                                sync_idx = find_sync_index(acceleration_columns["drag"], acc_thresh)
+                                orig_adjusted_time = orig_time_data - orig_time_data[max(sync_idx, 0)]
+
+                            accel_sources = []
                             if "inner" in acceleration_columns:
-                                accel_frame["Acceleration (Inner Capsule) (m/s²)"] = np.interp(
-                                    unified_time, orig_time_data, acceleration_columns["inner"]
+                                accel_sources.append(
+                                    (
+                                        "Acceleration (Inner Capsule) (m/s²)",
+                                        orig_time_data,
+                                        acceleration_columns["inner"],
+                                    )
                                 )
                             if "drag" in acceleration_columns:
-                                accel_frame["Acceleration (Drag Shield) (m/s²)"] = np.interp(
-                                    unified_time, orig_adjusted_time, acceleration_columns["drag"]
+                                accel_sources.append(
+                                    (
+                                        "Acceleration (Drag Shield) (m/s²)",
+                                        orig_adjusted_time,
+                                        acceleration_columns["drag"],
+                                    )
                                 )
+                            accel_frame = {"Time (s)": unified_time, **_interp_columns(unified_time, accel_sources)}
 
-                            acceleration_data = pd.DataFrame(accel_frame)
-                            logger.info(f"共通時間軸で加速度データを作成: {len(acceleration_data)}行")
+                            acceleration_data = accel_frame
+                            logger.info("共通時間軸で加速度データを作成: %d行", len(unified_time))
 
                     except Exception as e:
                         log_exception(e, "加速度データのエクスポート中にエラーが発生しました")
@@ -319,14 +462,26 @@ def export_data(
                 acceleration_data = None
 
         # Excelファイルにデータと統計情報を書き込む
-        with pd.ExcelWriter(output_file_path, engine="openpyxl") as writer:
-            export_data.to_excel(writer, sheet_name="Gravity Level Data", index=False)
-            stats_df.to_excel(writer, sheet_name="Gravity Level Statistics", index=False)
-            if acceleration_data is not None:
-                acceleration_data.to_excel(writer, sheet_name="Acceleration Data", index=False)
-                logger.info(f"加速度データをシートに追加しました: {len(acceleration_data)}行")
-            else:
-                logger.warning("加速度データが作成されなかったため、シートに追加されません")
+        # 先頭から順に書き出すだけなので、セルを保持しない書き込み専用モードを使う
+        workbook = Workbook(write_only=True)
+        _write_columns(workbook, "Gravity Level Data", export_columns)
+        stats_sheet = workbook.create_sheet(title="Gravity Level Statistics")
+        stats_sheet.append(["Statistic", "Value"])
+        for label, value in stats_rows:
+            stats_sheet.append([label, _cell_value(value)])
+        if acceleration_data is not None:
+            _write_columns(workbook, "Acceleration Data", acceleration_data)
+            logger.info("加速度データをシートに追加しました: %d行", len(unified_time))
+        else:
+            logger.warning("加速度データが作成されなかったため、シートに追加されません")
+        try:
+            workbook.save(output_file_path)
+        except Exception:
+            # 保存できなかった場合も、書き込み途中のシートのストリームを閉じておく
+            for sheet in workbook.worksheets:
+                if not sheet.closed:
+                    sheet.close()
+            raise
 
         graph_exists = graph_path is not None and Path(graph_path).exists()
         graph_display_target = new_graph_path if graph_exists else new_graph_path.parent
@@ -384,55 +539,40 @@ def export_g_quality_data(g_quality_data, original_file_path, g_quality_graph_pa
         # 同じファイルでない場合のみコピーを実行
 
         try:
-            # パスを正規化して比較
-            source_path = Path(g_quality_graph_path).resolve()
-            dest_path = new_graph_path.resolve()
+            # パスを正規化せず、同一ファイルかどうかを直接判定する（コピー先が未作成なら別ファイル）
+            try:
+                same_file = os.path.samefile(g_quality_graph_path, new_graph_path)
+            except FileNotFoundError:
+                same_file = False
 
-            if source_path != dest_path:
-                shutil.copy2(g_quality_graph_path, new_graph_path)
-                logger.info(f"G-qualityグラフを保存しました: {g_quality_graph_path} -> {new_graph_path}")
+            if not same_file:
+                shutil.copyfile(g_quality_graph_path, new_graph_path)
+                logger.info("G-qualityグラフを保存しました: %s -> %s", g_quality_graph_path, new_graph_path)
             else:
-                logger.debug(f"G-qualityグラフは既に正しい場所にあります: {new_graph_path}")
+                logger.debug("G-qualityグラフは既に正しい場所にあります: %s", new_graph_path)
         except Exception as e:
-            logger.warning(f"G-qualityグラフの保存中にエラーが発生しました: {e}")
-
-    # データフレームの作成
-    df = pd.DataFrame(
-        g_quality_data,
-        columns=[
-            "Window Size (s)",
-            "Inner Capsule: Time at smallest Standard Deviation(s)",
-            "Inner Capsule: Mean Gravity Level of the interval with the smallest standard deviation(G)",
-            "Inner Capsule: smallest Standard Deviation(G)",
-            "Drag Shield: Time at smallest Standard Deviation(s)",
-            "Drag Shield: Mean Gravity Level of the interval with the smallest standard deviation(G)",
-            "Drag Shield: smallest Standard Deviation(G)",
-        ],
-    )
+            logger.warning("G-qualityグラフの保存中にエラーが発生しました: %s", e)
 
     # 出力ファイルパスの設定
     output_file_path = results_dir / f"{base_name}.xlsx"
 
     try:
-        # 既存のExcelファイルを読み込むか、新規作成
-        try:
-            workbook = load_workbook(output_file_path)
-        except FileNotFoundError:
-            workbook = Workbook()
-            # デフォルトのシートを削除（後で必要なシートを追加する）
-            sheet_to_remove = workbook.active
-            if sheet_to_remove is not None:
-                workbook.remove(sheet_to_remove)
-
-        # G-quality Analysis シートを作成または更新
         sheet_name = "G-quality Analysis"
-        if sheet_name in workbook.sheetnames:
-            del workbook[sheet_name]
+        if output_file_path.exists():
+            # 既存のExcelファイルを更新する場合のみ読み込む
+            workbook = load_workbook(output_file_path)
+            if sheet_name in workbook.sheetnames:
+                del workbook[sheet_name]
+        else:
+            # 新規作成時はDOMを保持しない書き込み専用モードで出力する
+            workbook = Workbook(write_only=True)
         sheet = workbook.create_sheet(title=sheet_name)
 
         # データをシートに書き込む（1行目から開始）
-        for row in dataframe_to_rows(df, index=False, header=True):
-            sheet.append(row)
+        sheet.append(list(_G_QUALITY_COLUMNS))
+        for row in g_quality_data:
+            # 元のタプルをそのまま書き込む（NaN・±infは空セルにする）
+            sheet.append([_cell_value(value) for value in row])
 
         # ファイルを保存
         workbook.save(output_file_path)
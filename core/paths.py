@@ -7,6 +7,8 @@
 
 from __future__ import annotations
 
+import functools
+import os
 from pathlib import Path
 
 from core.logger import get_logger
@@ -28,18 +30,28 @@ def _normalize_base_dir(base: Path) -> Path:
 def resolve_base_dir(csv_dir: str | Path | None) -> Path:
     """
     CSVディレクトリが未指定の場合はプロジェクトルートを返し、指定されていれば正規化して返す。
+
+    シンボリックリンクの解決結果は絶対パスごとに直近32件まで保持する。
+    ファイルかどうかの判定は毎回行う。
     """
     if not csv_dir:
         logger.debug("csv_dirが指定されていないためプロジェクトルートを使用します")
         return _project_root()
 
-    base = Path(csv_dir).expanduser()
+    # 相対パスは作業ディレクトリに依存するため、絶対パスにしてからキーにする
+    absolute = os.path.abspath(os.path.expanduser(os.fspath(csv_dir)))
+    return _normalize_base_dir(_resolve_path(absolute))
+
+
+@functools.lru_cache(maxsize=32)
+def _resolve_path(csv_dir: str) -> Path:
+    # 同じディレクトリはセッション中に何度も解決されるため、絶対パスごとに結果を保持する
+    base = Path(csv_dir)
     try:
-        base = base.resolve()
+        return base.resolve()
     except OSError:
         # 存在しないパスでも処理を続ける
-        base = base.absolute()
-    return _normalize_base_dir(base)
+        return base
 
 
 def ensure_results_dir(csv_dir: str | Path | None) -> Path:
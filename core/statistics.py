@@ -8,12 +8,65 @@
 また、ユーザーが選択した特定範囲の統計情報も計算します。
 """
 
+from dataclasses import dataclass
+
 import numpy as np
 import pandas as pd
 
 
+@dataclass(frozen=True)
+class PrefixSums:
+    """
+    重力レベルデータのローリング集計用の累積和
+
+    いずれも先頭に0を持つ長さ `len(gravity_level) + 1` の配列で、
+    区間 [i, i + w) の合計は `array[i + w] - array[i]` で求まります。
+    NaNは集計から除外し、有効値の数を `count` で別途保持します。
+    """
+
+    count: np.ndarray
+    total: np.ndarray
+    squares: np.ndarray
+    absolute: np.ndarray
+
+
+def precompute_prefix_sums(gravity_level: pd.Series | np.ndarray) -> PrefixSums:
+    """
+    `calculate_statistics` で使う累積和を事前に計算する
+
+    G-quality解析のように同じデータをウィンドウサイズを変えて繰り返し集計する場合に、
+    結果を `calculate_statistics` の `prefix_sums` に渡すことで累積和の再計算を省けます。
+
+    Args:
+        gravity_level: 重力レベルデータ
+
+    Returns:
+        PrefixSums: 有効値数・合計・二乗和・絶対値和の累積和
+    """
+    gravity_array = np.asarray(gravity_level, dtype=np.float64)
+    valid_mask = ~np.isnan(gravity_array)
+
+    # 4系列を1つの (4, n + 1) 配列に直接書き込み、累積和も1回の呼び出しでまとめて計算する
+    # （系列ごとの一時配列を作らないため、メモリ確保と転送量が減る）
+    block = np.empty((4, len(gravity_array) + 1), dtype=np.float64)
+    block[:, 0] = 0.0
+    count, total, squares, absolute = block[:, 1:]
+    np.copyto(count, valid_mask)
+    np.copyto(total, gravity_array)
+    if not valid_mask.all():
+        total[~valid_mask] = 0.0
+    np.multiply(total, total, out=squares)
+    np.abs(total, out=absolute)
+    np.cumsum(block[:, 1:], axis=1, out=block[:, 1:])
+    return PrefixSums(count=block[0], total=block[1], squares=block[2], absolute=block[3])
+
+
 def calculate_statistics(
-    gravity_level: pd.Series, time: pd.Series, config: dict[str, float | int]
+    gravity_level: pd.Series,
+    time: pd.Series,
+    config: dict[str, float | int],
+    *,
+    prefix_sums: PrefixSums | None = None,
 ) -> tuple[float | None, float | None, float | None]:
     """
     重力レベルデータの統計情報を計算する
@@ -28,6 +81,7 @@ def calculate_statistics(
         config: 設定パラメータ辞書。以下のキーが使用されます：
             - window_size (float): 解析窓のサイズ（秒単位）、デフォルトは0.1
             - sampling_rate (int): サンプリングレート（Hz単位）、デフォルトは1000
+        prefix_sums: `precompute_prefix_sums(gravity_level)` の結果。指定された場合は累積和を再計算しない
 
     Returns:
         以下の3つの値を含むタプル
@@ -51,31 +105,22 @@ def calculate_statistics(
         return None, None, None
 
     # numpy配列に変換
-    gravity_array: np.ndarray = np.asarray(gravity_level.values, dtype=np.float64)
     time_array: np.ndarray = np.asarray(time.values, dtype=np.float64)
 
-    num_windows = len(gravity_array) - window_size_samples + 1
+    num_windows = len(gravity_level) - window_size_samples + 1
 
     # NaN対応のベクトル化ローリング計算 O(n)
-    # NaNを0に置換し、有効値のカウントを別途追跡する
-    valid_mask = ~np.isnan(gravity_array)
-    safe_vals = np.where(valid_mask, gravity_array, 0.0)
-    abs_vals = np.where(valid_mask, np.abs(gravity_array), 0.0)
-    sq_vals = np.where(valid_mask, gravity_array**2, 0.0)
-    valid_f = valid_mask.astype(np.float64)
-
-    # 累積和によるローリングウィンドウ集計（O(n)）
-    def _rolling_sum(arr: np.ndarray, w: int) -> np.ndarray:
-        cs = np.empty(len(arr) + 1, dtype=np.float64)
-        cs[0] = 0.0
-        np.cumsum(arr, out=cs[1:])
-        return cs[w:] - cs[:-w]
+    # NaNを0に置換した累積和と、有効値のカウントの累積和から各ウィンドウを集計する
+    if prefix_sums is None:
+        prefix_sums = precompute_prefix_sums(gravity_level)
+    elif len(prefix_sums.count) != len(gravity_level) + 1:
+        raise ValueError("prefix_sums の長さが gravity_level と一致しません")
 
     w = window_size_samples
-    count = _rolling_sum(valid_f, w)  # 各ウィンドウの有効値数
-    sum_x = _rolling_sum(safe_vals, w)  # Σx
-    sum_x2 = _rolling_sum(sq_vals, w)  # Σx²
-    sum_abs = _rolling_sum(abs_vals, w)  # Σ|x|
+    count = prefix_sums.count[w:] - prefix_sums.count[:-w]  # 各ウィンドウの有効値数
+    sum_x = prefix_sums.total[w:] - prefix_sums.total[:-w]  # Σx
+    sum_x2 = prefix_sums.squares[w:] - prefix_sums.squares[:-w]  # Σx²
+    sum_abs = prefix_sums.absolute[w:] - prefix_sums.absolute[:-w]  # Σ|x|
 
     # ウィンドウ内に有効値がない場合はNaN
     with np.errstate(invalid="ignore", divide="ignore"):
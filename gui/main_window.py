@@ -17,7 +17,6 @@ import matplotlib
 matplotlib.use("qtagg")  # PySide6対応のバックエンドを使用
 import matplotlib.pyplot as plt
 import numpy as np
-import pandas as pd
 from matplotlib import font_manager
 from matplotlib.backends.backend_qt import NavigationToolbar2QT as NavigationToolbar
 from matplotlib.backends.backend_qtagg import FigureCanvasQTAgg as FigureCanvas
@@ -47,7 +46,7 @@ from PySide6.QtWidgets import (
 
 from core.cache_manager import delete_cache
 from core.config import load_config, save_config
-from core.data_processor import detect_columns, filter_data, load_and_process_data
+from core.data_processor import detect_columns, filter_data, load_and_process_data, read_raw_data
 from core.exceptions import ColumnNotFoundError, DataProcessingError
 from core.export import create_output_directories, export_data, export_g_quality_data
 from core.logger import get_logger, log_exception
@@ -1007,10 +1006,22 @@ class MainWindow(QMainWindow):
             from core.cache_manager import (
                 generate_cache_id,
                 has_valid_cache,
-                load_from_cache,
+                has_valid_cache_bulk,
+                open_cache,
                 save_to_cache,
             )
 
+            # キャッシュ有無を先にまとめて確認する（結果は目安で、読み込み直前に open_cache で検証し直す）
+            # 処理済みのファイルは再処理でキャッシュを使わない可能性があるため対象から除く
+            cache_status = {}
+            if self.config.get("use_cache", True):
+                scan_paths = [
+                    path
+                    for path in file_paths
+                    if os.path.splitext(os.path.basename(path))[0] not in self.processed_data
+                ]
+                cache_status = has_valid_cache_bulk(scan_paths, self.config)
+
             batch_cache_decision = None  # None=毎回確認, True=すべてはい, False=すべていいえ
             for file_idx, file_path in enumerate(file_paths):
                 logger.info(f"ファイル処理開始 ({file_idx + 1}/{total_files}): {file_path}")
@@ -1095,7 +1106,7 @@ class MainWindow(QMainWindow):
 
                 # キャッシュの確認
                 if self.config.get("use_cache", True) and not force_reprocess:
-                    has_cache, cache_id = has_valid_cache(file_path, self.config)
+                    has_cache, _ = cache_status.get(file_path) or has_valid_cache(file_path, self.config)
                     if has_cache:
                         # バッチ決定がまだない場合のみ確認
                         if batch_cache_decision is None:
@@ -1132,8 +1143,9 @@ class MainWindow(QMainWindow):
                             )
                             QApplication.processEvents()
 
-                            cached_data = load_from_cache(file_path, cache_id)
-                            if cached_data:
+                            # 確認ダイアログの間に変化していないか検証し直してから読み込む
+                            cached_data, cache_loaded = open_cache(file_path, self.config)
+                            if cache_loaded and cached_data:
                                 # キャッシュデータをロード
                                 self.processed_data[file_name_without_ext] = cached_data
                                 self.file_paths[file_name_without_ext] = file_path
@@ -1164,8 +1176,8 @@ class MainWindow(QMainWindow):
 
                 # データの読み込みと処理
                 try:
-                    # 元のCSVデータを読み込む
-                    raw_data = pd.read_csv(file_path)
+                    # 元のCSVデータを読み込む（load_and_process_dataにはこの解析結果を渡して再解析を避ける）
+                    raw_data = read_raw_data(file_path)
                     self.file_progress_bar.setValue(20)
                     QApplication.processEvents()
 
@@ -1175,20 +1187,17 @@ class MainWindow(QMainWindow):
                         gravity_level_inner_capsule,
                         gravity_level_drag_shield,
                         adjusted_time,
-                    ) = load_and_process_data(file_path, self.config)
+                    ) = load_and_process_data(file_path, self.config, raw_data=raw_data)
                     self.file_progress_bar.setValue(40)
                     QApplication.processEvents()
 
-                except ColumnNotFoundError:
+                except ColumnNotFoundError as column_error:
                     # 時間列と加速度列の候補を取得
                     time_columns, accel_columns = detect_columns(file_path)
+                    # エラーに含まれる列一覧を使い、CSVを読み直さない
+                    col_list = ", ".join(column_error.available_columns[:20]) or "(列名を取得できません)"
 
                     if not time_columns:
-                        try:
-                            all_cols = pd.read_csv(file_path, nrows=0).columns.tolist()
-                            col_list = ", ".join(all_cols[:20])
-                        except Exception:
-                            col_list = "(列名を取得できません)"
                         self._show_error_dialog(
                             "エラー",
                             "CSVファイルに時間列の候補が見つかりませんでした。",
@@ -1198,11 +1207,6 @@ class MainWindow(QMainWindow):
                         continue
 
                     if not accel_columns:
-                        try:
-                            all_cols = pd.read_csv(file_path, nrows=0).columns.tolist()
-                            col_list = ", ".join(all_cols[:20])
-                        except Exception:
-                            col_list = "(列名を取得できません)"
                         self._show_error_dialog(
                             "エラー",
                             "CSVファイルに加速度列の候補が見つかりませんでした。",
@@ -1239,7 +1243,7 @@ class MainWindow(QMainWindow):
                                 gravity_level_inner_capsule,
                                 gravity_level_drag_shield,
                                 adjusted_time,
-                            ) = load_and_process_data(file_path, temp_config)
+                            ) = load_and_process_data(file_path, temp_config, raw_data=raw_data)
                             self.file_progress_bar.setValue(40)
                             QApplication.processEvents()
 
@@ -1317,12 +1321,15 @@ class MainWindow(QMainWindow):
                     )
                     QApplication.processEvents()
 
-                    cache_id = generate_cache_id(file_path, self.config)
+                    file_stat = os.stat(file_path)
+                    cache_id = generate_cache_id(file_path, self.config, file_stat)
                     save_to_cache(
                         self.processed_data[file_name_without_ext],
                         file_path,
                         cache_id,
                         self.config,
+                        background=True,
+                        file_stat=file_stat,
                     )
 
                 # グラフの作成と保存
@@ -1516,12 +1523,15 @@ class MainWindow(QMainWindow):
         if self.config.get("use_cache", True) and original_file_path:
             from core.cache_manager import generate_cache_id, save_to_cache
 
-            cache_id = generate_cache_id(original_file_path, self.config)
+            file_stat = os.stat(original_file_path)
+            cache_id = generate_cache_id(original_file_path, self.config, file_stat)
             save_to_cache(
                 self.processed_data[dataset_name],
                 original_file_path,
                 cache_id,
                 self.config,
+                background=True,
+                file_stat=file_stat,
             )
 
         logger.info(f"G-quality評価が完了しました: {dataset_name}")
@@ -2578,12 +2588,15 @@ class MainWindow(QMainWindow):
         if self.config.get("use_cache", True) and original_file_path:
             from core.cache_manager import generate_cache_id, save_to_cache
 
-            cache_id = generate_cache_id(original_file_path, self.config)
+            file_stat = os.stat(original_file_path)
+            cache_id = generate_cache_id(original_file_path, self.config, file_stat)
             save_to_cache(
                 self.processed_data[dataset_name],
                 original_file_path,
                 cache_id,
                 self.config,
+                background=True,
+                file_stat=file_stat,
             )
 
         logger.info(f"G-quality評価が完了しました: {dataset_name}")
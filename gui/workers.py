@@ -10,7 +10,7 @@ import numpy as np
 from PySide6.QtCore import QThread, Signal
 
 from core.logger import get_logger, log_exception
-from core.statistics import calculate_statistics
+from core.statistics import calculate_statistics, precompute_prefix_sums
 
 # モジュール用のロガーを初期化
 logger = get_logger("workers")
@@ -96,6 +96,19 @@ class GQualityWorker(QThread):
             if not self.wait(1000):  # さらに1秒待機
                 logger.error("ワーカースレッドの強制終了に失敗しました")
 
+    @staticmethod
+    def _precompute_prefix_sums(gravity_level, has_data):
+        """
+        累積和を事前計算する（計算できない場合はNoneを返し、ウィンドウごとの計算に任せる）
+        """
+        if not has_data:
+            return None
+        try:
+            return precompute_prefix_sums(gravity_level)
+        except Exception as e:
+            log_exception(e, "G-quality解析用の累積和の事前計算中にエラー")
+            return None
+
     def run(self):
         """
         スレッドの実行メソッド
@@ -151,6 +164,10 @@ class GQualityWorker(QThread):
                 self.finished.emit([])
                 return
 
+            # ウィンドウサイズを変えても累積和は共通なので、センサーごとに1回だけ計算しておく
+            prefix_sums_inner = self._precompute_prefix_sums(self.filtered_gravity_level_inner_capsule, has_inner)
+            prefix_sums_drag = self._precompute_prefix_sums(self.filtered_gravity_level_drag_shield, has_drag)
+
             # 全体の進捗を更新
             self.overall_progress.emit(self.file_index, self.total_files)
 
@@ -189,6 +206,7 @@ class GQualityWorker(QThread):
                                 "window_size": window_size,
                                 "sampling_rate": self.config["sampling_rate"],
                             },
+                            prefix_sums=prefix_sums_inner,
                         )
                 except Exception as e:
                     log_exception(e, f"Inner Capsule: ウィンドウサイズ {window_size}秒 での統計計算中にエラー")
@@ -206,6 +224,7 @@ class GQualityWorker(QThread):
                                 "window_size": window_size,
                                 "sampling_rate": self.config["sampling_rate"],
                             },
+                            prefix_sums=prefix_sums_drag,
                         )
                 except Exception as e:
                     log_exception(e, f"Drag Shield: ウィンドウサイズ {window_size}秒 での統計計算中にエラー")
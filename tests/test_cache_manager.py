@@ -1,14 +1,26 @@
+import logging
+import os
 import pickle
 from pathlib import Path
 
+import numpy as np
 import pandas as pd
+import pytest
 
 from core.cache_manager import (
+    _CACHE_RELEVANT_KEYS,
+    _ZSTD_MAGIC,
+    _compute_cache_id,
+    _downcast_raw_data,
+    _dump_cache_pickle,
+    _load_cache_pickle,
     delete_cache,
     generate_cache_id,
     get_cache_path,
     has_valid_cache,
+    has_valid_cache_bulk,
     load_from_cache,
+    open_cache,
     save_to_cache,
 )
 from core.version import APP_VERSION
@@ -91,11 +103,9 @@ def test_load_from_cache_returns_none_on_version_mismatch(sample_config, raw_dat
     save_to_cache({"raw_data": raw_data_frame}, str(csv_path), cache_id, config)
 
     cache_file = Path(get_cache_path(str(csv_path), cache_id))
-    with cache_file.open("rb") as fh:
-        data = pickle.load(fh)
+    data = _load_cache_pickle(cache_file)
     data["_metadata"]["app_version"] = "0.0.1"
-    with cache_file.open("wb") as fh:
-        pickle.dump(data, fh)
+    _dump_cache_pickle(data, cache_file)
 
     assert load_from_cache(str(csv_path), cache_id) is None
 
@@ -111,3 +121,270 @@ def test_load_from_cache_handles_raw_data_read_error(monkeypatch, sample_config,
     monkeypatch.setattr("pandas.read_hdf", lambda *args, **kwargs: (_ for _ in ()).throw(ValueError("boom")))
 
     assert load_from_cache(str(csv_path), cache_id) is None
+
+
+def test_cache_file_is_zstd_compressed_when_available(sample_config, raw_data_frame, tmp_path):
+    pytest.importorskip("zstandard")
+    csv_path = tmp_path / "data.csv"
+    raw_data_frame.to_csv(csv_path, index=False)
+    config = sample_config | {"app_version": APP_VERSION}
+
+    cache_id = generate_cache_id(str(csv_path), config)
+    save_to_cache({"result": [1, 2, 3], "raw_data": raw_data_frame}, str(csv_path), cache_id, config)
+
+    cache_file = Path(get_cache_path(str(csv_path), cache_id))
+    assert cache_file.read_bytes()[: len(_ZSTD_MAGIC)] == _ZSTD_MAGIC
+    assert load_from_cache(str(csv_path), cache_id)["result"] == [1, 2, 3]
+
+
+def test_cache_metadata_records_every_cache_id_key(sample_config, raw_data_frame, tmp_path):
+    csv_path = tmp_path / "data.csv"
+    raw_data_frame.to_csv(csv_path, index=False)
+    config = sample_config | {"app_version": APP_VERSION, "use_float32": True, "window_size": 0.2}
+
+    cache_id = generate_cache_id(str(csv_path), config)
+    save_to_cache({"result": [1]}, str(csv_path), cache_id, config)
+
+    metadata = _load_cache_pickle(get_cache_path(str(csv_path), cache_id))["_metadata"]
+    assert tuple(metadata["config"]) == _CACHE_RELEVANT_KEYS
+    assert metadata["config"]["use_float32"] is True
+    assert metadata["config"]["window_size"] == 0.2
+
+
+def test_load_cache_pickle_reads_uncompressed_files(tmp_path):
+    cache_file = tmp_path / "legacy.pickle"
+    cache_file.write_bytes(pickle.dumps({"result": [1, 2, 3]}))
+
+    assert _load_cache_pickle(cache_file) == {"result": [1, 2, 3]}
+
+
+def test_downcast_raw_data_only_applies_lossless_conversions():
+    frame = pd.DataFrame(
+        {
+            "sample": np.arange(5, dtype=np.int64),
+            "exact": np.array([0.0, 0.5, 1.25, -2.0, np.nan]),
+            "acc": np.array([0.0, 0.98, 0.98, 2.0, 1.5]),
+        }
+    )
+
+    shrunk = _downcast_raw_data(frame)
+
+    assert shrunk["sample"].dtype == np.int8
+    assert shrunk["exact"].dtype == np.float32
+    assert shrunk["acc"].dtype == np.float64
+    np.testing.assert_array_equal(shrunk.to_numpy(np.float64), frame.to_numpy(np.float64))
+    assert frame["sample"].dtype == np.int64
+
+
+def test_has_valid_cache_checks_existence_without_reading_cache(monkeypatch, sample_config, raw_data_frame, tmp_path):
+    csv_path = tmp_path / "data.csv"
+    raw_data_frame.to_csv(csv_path, index=False)
+    config = sample_config | {"app_version": APP_VERSION}
+
+    cache_id = generate_cache_id(str(csv_path), config)
+    save_to_cache({"raw_data": raw_data_frame}, str(csv_path), cache_id, config)
+
+    def _fail(*args, **kwargs):
+        raise AssertionError("cache files should not be read")
+
+    monkeypatch.setattr("core.cache_manager._load_cache_pickle", _fail)
+
+    assert has_valid_cache(str(csv_path), config) == (True, cache_id)
+
+
+def test_generate_cache_id_changes_with_app_version(monkeypatch, sample_config, tmp_path):
+    csv_path = tmp_path / "data.csv"
+    csv_path.write_text("time_s,acc_ic,acc_ds\n0,0,0\n")
+    config = sample_config | {"app_version": APP_VERSION}
+
+    cache_id = generate_cache_id(str(csv_path), config)
+    # 設定ファイル側に残った古いバージョン文字列はIDに影響しない
+    assert generate_cache_id(str(csv_path), config | {"app_version": "9.1.0"}) == cache_id
+
+    monkeypatch.setattr("core.cache_manager.APP_VERSION", "0.0.1")
+    assert generate_cache_id(str(csv_path), config) != cache_id
+
+
+def test_generate_cache_id_is_memoized_until_mtime_changes(sample_config, tmp_path):
+    csv_path = tmp_path / "data.csv"
+    csv_path.write_text("time_s,acc_ic,acc_ds\n0,0,0\n")
+    config = sample_config | {"app_version": APP_VERSION}
+
+    _compute_cache_id.cache_clear()
+    cache_id = generate_cache_id(str(csv_path), config)
+    assert generate_cache_id(str(csv_path), dict(config)) == cache_id
+    assert _compute_cache_id.cache_info().hits == 1
+
+    stat = csv_path.stat()
+    os.utime(csv_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    assert generate_cache_id(str(csv_path), config) != cache_id
+
+
+def test_delete_cache_without_id_removes_only_that_files_caches(sample_config, raw_data_frame, tmp_path):
+    config = sample_config | {"app_version": APP_VERSION}
+    cache_files = {}
+    for name in ("alpha", "beta"):
+        csv_path = tmp_path / f"{name}.csv"
+        raw_data_frame.to_csv(csv_path, index=False)
+        cache_id = generate_cache_id(str(csv_path), config)
+        save_to_cache({"raw_data": raw_data_frame}, str(csv_path), cache_id, config)
+        cache_files[name] = Path(get_cache_path(str(csv_path), cache_id))
+
+    assert delete_cache(str(tmp_path / "alpha.csv")) is True
+
+    cache_dir = cache_files["alpha"].parent
+    assert not any(path.name.startswith("alpha_") for path in cache_dir.iterdir())
+    assert cache_files["beta"].exists()
+
+
+def test_open_cache_loads_valid_cache_and_skips_stale_one(sample_config, raw_data_frame, tmp_path):
+    csv_path = tmp_path / "sample.csv"
+    raw_data_frame.to_csv(csv_path, index=False)
+    config = sample_config | {"app_version": APP_VERSION}
+    cache_id = generate_cache_id(str(csv_path), config)
+    save_to_cache({"raw_data": raw_data_frame, "result": 42}, str(csv_path), cache_id, config)
+
+    data, valid = open_cache(str(csv_path), config)
+    assert valid is True
+    assert data["result"] == 42
+    assert "_metadata" not in data
+
+    assert open_cache(str(csv_path), config | {"use_cache": False}) == (None, False)
+
+
+def test_cache_pickle_stores_arrays_out_of_band(tmp_path):
+    cache_path = tmp_path / "sample_abc.pickle"
+    values = np.arange(10_000, dtype=np.float64)
+    series = pd.Series(np.linspace(0.0, 1.0, 257), name="g")
+
+    _dump_cache_pickle({"values": values, "series": series, "label": "x"}, cache_path)
+
+    buffer_path = cache_path.with_suffix(".buf")
+    assert buffer_path.exists()
+    assert cache_path.stat().st_size < values.nbytes
+
+    loaded = _load_cache_pickle(cache_path)
+    np.testing.assert_array_equal(loaded["values"], values)
+    pd.testing.assert_series_equal(loaded["series"], series)
+    assert loaded["label"] == "x"
+    loaded["values"][0] = -1.0  # 復元した配列は書き込み可能
+
+    buffer_path.unlink()
+    with pytest.raises(pickle.UnpicklingError):
+        _load_cache_pickle(cache_path)
+
+
+def test_cache_buffers_are_zstd_compressed_and_read_back(monkeypatch, tmp_path):
+    pytest.importorskip("zstandard")
+    values = np.zeros(100_000, dtype=np.float64)
+
+    cache_path = tmp_path / "sample_abc.pickle"
+    _dump_cache_pickle({"values": values}, cache_path)
+    buffer_path = cache_path.with_suffix(".buf")
+    assert buffer_path.read_bytes()[: len(_ZSTD_MAGIC)] == _ZSTD_MAGIC
+    assert buffer_path.stat().st_size < values.nbytes
+    np.testing.assert_array_equal(_load_cache_pickle(cache_path)["values"], values)
+
+    # zstandardが無い環境で書いた非圧縮のバッファも読み込める
+    monkeypatch.setattr("core.cache_manager.zstandard", None)
+    plain_path = tmp_path / "sample_def.pickle"
+    _dump_cache_pickle({"values": values}, plain_path)
+    assert plain_path.with_suffix(".buf").stat().st_size > values.nbytes
+    monkeypatch.undo()
+    np.testing.assert_array_equal(_load_cache_pickle(plain_path)["values"], values)
+
+
+def test_save_to_cache_in_background_is_visible_to_readers(sample_config, raw_data_frame, tmp_path):
+    csv_path = tmp_path / "sample.csv"
+    raw_data_frame.to_csv(csv_path, index=False)
+    config = sample_config | {"app_version": APP_VERSION}
+    cache_id = generate_cache_id(str(csv_path), config)
+    processed = {"raw_data": raw_data_frame, "result": [1, 2, 3]}
+
+    assert save_to_cache(processed, str(csv_path), cache_id, config, background=True) is True
+    assert processed["raw_data"] is raw_data_frame
+
+    # 読み込み側は保留中の書き込みの完了を待つ
+    assert has_valid_cache(str(csv_path), config) == (True, cache_id)
+    assert load_from_cache(str(csv_path), cache_id)["result"] == [1, 2, 3]
+
+
+def test_generate_cache_id_uses_given_stat_and_file_size(sample_config, tmp_path):
+    csv_path = tmp_path / "data.csv"
+    csv_path.write_text("time_s,acc_ic,acc_ds\n0,0,0\n")
+    config = sample_config | {"app_version": APP_VERSION}
+
+    stat = csv_path.stat()
+    cache_id = generate_cache_id(str(csv_path), config, stat)
+    assert generate_cache_id(str(csv_path), config) == cache_id
+
+    # 更新時間が同じでもサイズが変われば別のキャッシュになる
+    csv_path.write_text("time_s,acc_ic,acc_ds\n0,0,0\n1,1,1\n")
+    os.utime(csv_path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+    assert generate_cache_id(str(csv_path), config) != cache_id
+
+
+def test_save_to_cache_compresses_raw_data_hdf(sample_config, raw_data_frame, tmp_path):
+    tables = pytest.importorskip("tables")
+    csv_path = tmp_path / "data.csv"
+    raw_data_frame.to_csv(csv_path, index=False)
+    config = sample_config | {"app_version": APP_VERSION}
+
+    cache_id = generate_cache_id(str(csv_path), config)
+    save_to_cache({"raw_data": raw_data_frame}, str(csv_path), cache_id, config)
+
+    raw_path = Path(get_cache_path(str(csv_path), cache_id)).with_name(f"data_{cache_id}_raw.h5")
+    with tables.open_file(raw_path) as h5:
+        filters = {node.filters.complib for node in h5.walk_nodes("/raw_data", classname="Leaf")}
+    assert filters == {"blosc:lz4"}
+    pd.testing.assert_frame_equal(
+        load_from_cache(str(csv_path), cache_id)["raw_data"], raw_data_frame, check_dtype=False
+    )
+
+
+def test_has_valid_cache_bulk_matches_single_file_checks(sample_config, raw_data_frame, tmp_path):
+    config = sample_config | {"app_version": APP_VERSION}
+    csv_paths = []
+    for name in ("cached", "fresh", "other"):
+        csv_path = tmp_path / f"{name}.csv"
+        raw_data_frame.to_csv(csv_path, index=False)
+        csv_paths.append(str(csv_path))
+    cache_id = generate_cache_id(csv_paths[0], config)
+    save_to_cache({"raw_data": raw_data_frame}, csv_paths[0], cache_id, config)
+
+    results = has_valid_cache_bulk(csv_paths, config, max_workers=3)
+
+    assert results == {path: has_valid_cache(path, config) for path in csv_paths}
+    assert results[csv_paths[0]] == (True, cache_id)
+    assert results[csv_paths[1]][0] is False
+    assert has_valid_cache_bulk([], config) == {}
+
+
+def test_has_valid_cache_bulk_has_no_side_effects(caplog, sample_config, tmp_path):
+    config = sample_config | {"app_version": APP_VERSION}
+    csv_paths = []
+    for name in ("a", "b"):
+        csv_path = tmp_path / f"{name}.csv"
+        csv_path.write_text("time_s,acc_ic,acc_ds\n0,0,0\n")
+        csv_paths.append(str(csv_path))
+
+    with caplog.at_level(logging.INFO, logger="AAT"):
+        results = has_valid_cache_bulk(csv_paths, config, max_workers=2)
+
+    assert all(valid is False for valid, _ in results.values())
+    assert not (tmp_path / "results_AAT").exists()
+    assert not [record for record in caplog.records if record.levelno >= logging.INFO]
+
+
+def test_save_to_cache_leaves_caller_dict_unchanged(sample_config, raw_data_frame, tmp_path):
+    csv_path = tmp_path / "data.csv"
+    raw_data_frame.to_csv(csv_path, index=False)
+    config = sample_config | {"app_version": APP_VERSION}
+    cache_id = generate_cache_id(str(csv_path), config)
+    processed = {"raw_data": raw_data_frame, "result": [1, 2, 3]}
+
+    assert save_to_cache(processed, str(csv_path), cache_id, config) is True
+
+    assert processed.keys() == {"raw_data", "result"}
+    assert processed["raw_data"] is raw_data_frame
+    assert load_from_cache(str(csv_path), cache_id)["raw_data"] is not None
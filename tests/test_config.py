@@ -1,6 +1,7 @@
 import json
+import os
 
-from core.config import load_config, save_config
+from core.config import clear_config_cache, load_config, save_config
 from core.version import APP_VERSION
 
 
@@ -62,3 +63,83 @@ def test_save_config_creates_backup_for_existing_file(tmp_path, monkeypatch, dum
     backup_path = user_dir / "config.json.bak"
     assert backup_path.exists()
     assert json.loads(backup_path.read_text(encoding="utf-8"))["old"] == 1
+
+
+def test_save_config_output_matches_without_orjson(tmp_path, monkeypatch, dummy_message_box):
+    user_dir = tmp_path / "user_dir"
+    monkeypatch.setenv("AAT_CONFIG_DIR", str(user_dir))
+    config = {"time_column": "時間", "gravity_constant": 9.797578, "window_size": 0.1 + 0.2, "flags": [True, None]}
+
+    assert save_config(config) is True
+    written = (user_dir / "config.json").read_bytes()
+    assert json.loads(written)["window_size"] == 0.3
+
+    monkeypatch.setattr("core.config.orjson", None)
+    assert save_config(config) is True
+    assert (user_dir / "config.json").read_bytes() == written
+
+
+def test_load_config_reuses_parsed_config_until_file_changes(
+    app_root_with_default, tmp_path, monkeypatch, dummy_message_box
+):
+    user_dir = tmp_path / "user_dir"
+    user_dir.mkdir(parents=True)
+    monkeypatch.setenv("AAT_CONFIG_DIR", str(user_dir))
+    config_path = user_dir / "config.json"
+    config_path.write_text(json.dumps({"time_column": "first"}), encoding="utf-8")
+
+    first = load_config()
+    first["time_column"] = "mutated by caller"
+    assert load_config()["time_column"] == "first"
+
+    config_path.write_text(json.dumps({"time_column": "second"}), encoding="utf-8")
+    os.utime(config_path, ns=(config_path.stat().st_atime_ns, config_path.stat().st_mtime_ns + 1_000_000))
+    assert load_config()["time_column"] == "second"
+
+
+def test_load_config_without_orjson_matches(app_root_with_default, tmp_path, monkeypatch, dummy_message_box):
+    default_config, _ = app_root_with_default
+    user_dir = tmp_path / "user_dir"
+    user_dir.mkdir(parents=True)
+    monkeypatch.setenv("AAT_CONFIG_DIR", str(user_dir))
+    (user_dir / "config.json").write_text(json.dumps({"time_column": "時間(s)"}, ensure_ascii=False), encoding="utf-8")
+
+    with_default_parser = load_config()
+    monkeypatch.setattr("core.config.orjson", None)
+    clear_config_cache()
+    without_orjson = load_config()
+
+    assert with_default_parser == without_orjson
+    assert without_orjson["time_column"] == "時間(s)"
+
+    (user_dir / "config.json").write_text("{invalid json", encoding="utf-8")
+    clear_config_cache()
+    assert load_config()["time_column"] == default_config["time_column"]
+
+
+def test_load_config_overlays_default_file_on_builtin_defaults(
+    app_root_with_default, tmp_path, monkeypatch, dummy_message_box
+):
+    from core.config import _DEFAULT_CONFIG
+
+    _, app_root = app_root_with_default
+    monkeypatch.setenv("AAT_CONFIG_DIR", str(tmp_path / "user_dir"))
+
+    config = load_config()
+    assert config["sampling_rate"] == 10
+    assert config["end_gravity_level"] == _DEFAULT_CONFIG["end_gravity_level"]
+
+    (app_root / "config" / "config.default.json").unlink()
+    clear_config_cache()
+    config = load_config()
+    assert config["sampling_rate"] == 10  # ユーザー設定にコピー済みの値
+    assert config["window_size"] == _DEFAULT_CONFIG["window_size"]
+
+
+def test_builtin_defaults_match_default_config_file():
+    from pathlib import Path
+
+    from core.config import _DEFAULT_CONFIG
+
+    default_path = Path(__file__).resolve().parent.parent / "config" / "config.default.json"
+    assert set(json.loads(default_path.read_text(encoding="utf-8"))) == set(_DEFAULT_CONFIG)
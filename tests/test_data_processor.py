@@ -1,7 +1,10 @@
+import os
+
+import numpy as np
 import pandas as pd
 import pytest
 
-from core.data_processor import detect_columns, filter_data, load_and_process_data
+from core.data_processor import _parse_csv, _read_csv, detect_columns, filter_data, load_and_process_data
 from core.exceptions import (
     ColumnNotFoundError,
     DataLoadError,
@@ -312,3 +315,276 @@ def test_load_and_process_data_raises_processing_error_for_zero_gravity_constant
 
     with pytest.raises(DataProcessingError, match="重力定数が0に設定されています"):
         load_and_process_data(sample_csv_file, broken_config)
+
+
+def test_read_csv_matches_with_and_without_pyarrow(monkeypatch, sample_csv_file):
+    pytest.importorskip("pyarrow")
+
+    with_pyarrow = _read_csv(str(sample_csv_file))
+    monkeypatch.setattr("core.data_processor.pyarrow", None)
+    without_pyarrow = _read_csv(str(sample_csv_file))
+
+    pd.testing.assert_frame_equal(with_pyarrow, without_pyarrow)
+
+
+def test_detect_columns_reuses_result_until_file_changes(monkeypatch, tmp_path):
+    csv_path = tmp_path / "detect.csv"
+    csv_path.write_text("time,acc_a\n0,1\n")
+    first = detect_columns(str(csv_path))
+    first[0].append("mutated")
+
+    def _fail(*args, **kwargs):
+        raise AssertionError("CSV should not be re-read")
+
+    monkeypatch.setattr("core.data_processor._read_csv", _fail)
+    assert detect_columns(str(csv_path)) == (["time"], ["acc_a"])
+
+    monkeypatch.undo()
+    csv_path.write_text("sec,g_value\n0,1\n")
+    stat = csv_path.stat()
+    os.utime(csv_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    assert detect_columns(str(csv_path)) == (["sec"], ["g_value"])
+
+    # 更新時刻が同じでもサイズが変われば検出し直す
+    stat = csv_path.stat()
+    csv_path.write_text("seconds,acc_value\n0,1\n")
+    os.utime(csv_path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+    assert detect_columns(str(csv_path)) == (["seconds"], ["acc_value"])
+
+
+def test_load_and_process_data_reuses_parsed_csv(monkeypatch, sample_csv_file, sample_config):
+    first = load_and_process_data(sample_csv_file, sample_config)
+
+    def _fail(*args, **kwargs):
+        raise AssertionError("CSV should not be re-parsed")
+
+    monkeypatch.setattr("core.data_processor._read_csv", _fail)
+    second = load_and_process_data(sample_csv_file, sample_config)
+
+    for before, after in zip(first, second, strict=True):
+        pd.testing.assert_series_equal(before, after)
+    parsed = _parse_csv(
+        sample_csv_file,
+        (
+            sample_config["time_column"],
+            sample_config["acceleration_column_inner_capsule"],
+            sample_config["acceleration_column_drag_shield"],
+        ),
+    )
+    assert parsed.columns == (
+        sample_config["time_column"],
+        sample_config["acceleration_column_inner_capsule"],
+        sample_config["acceleration_column_drag_shield"],
+    )
+    assert not parsed.arrays[sample_config["time_column"]].flags.writeable
+    assert not np.shares_memory(second[0].to_numpy(), parsed.arrays[sample_config["time_column"]])
+
+
+def test_load_and_process_data_reads_only_configured_columns(tmp_path, sample_config):
+    csv_path = tmp_path / "extra.csv"
+    csv_path.write_text(
+        "note,time_s,acc_ic,acc_ds\nstart,0.0,0.0,0.0\nfree,0.1,0.0,0.0\nend,0.2,2.0,2.0\n",
+        encoding="utf-8",
+    )
+
+    adjusted_time_inner, gravity_inner, _, _ = load_and_process_data(str(csv_path), sample_config)
+
+    assert adjusted_time_inner.dtype == np.float64
+    assert gravity_inner.tolist() == [0.0, 0.0, pytest.approx(2.0 / sample_config["gravity_constant"])]
+
+    with pytest.raises(ColumnNotFoundError) as excinfo:
+        load_and_process_data(str(csv_path), {**sample_config, "time_column": "missing"})
+    assert excinfo.value.available_columns == ["note", "time_s", "acc_ic", "acc_ds"]
+
+
+def test_first_true_and_end_index_after_min_index():
+    from core.data_processor import _find_end_indices, _first_true
+
+    assert _first_true(np.array([False, True, True])) == 1
+    assert _first_true(np.array([False, False])) == -1
+    assert _first_true(np.array([], dtype=bool)) == -1
+
+    # 最小インデックスより前の到達は無視される
+    gravity = pd.Series([1.5, 0.0, 0.1, 1.2, 0.0])
+    assert _find_end_indices(gravity, gravity, 2, 4, 1.0) == (3, 4)
+
+
+def test_filter_data_accepts_numpy_arrays(sample_csv_file, sample_config):
+    time, inner, drag, adjusted_time = load_and_process_data(str(sample_csv_file), sample_config)
+
+    from_series = filter_data(time, inner, drag, adjusted_time, sample_config)
+    from_arrays = filter_data(
+        time.to_numpy(), inner.to_numpy(), drag.to_numpy(), adjusted_time.to_numpy(), sample_config
+    )
+
+    for expected, actual in zip(from_series[:4], from_arrays[:4], strict=True):
+        np.testing.assert_array_equal(actual.to_numpy(), expected.to_numpy())
+    assert from_arrays[4] == from_series[4]
+
+
+def test_first_index_scans_across_blocks(monkeypatch):
+    from core.data_processor import _first_index, _scan_and_normalize
+
+    monkeypatch.setattr("core.data_processor._SCAN_BLOCK", 4)
+    values = np.array([5.0, 6.0, 7.0, 8.0, 9.0, 0.5, 0.2, 3.0, 0.1])
+
+    assert _first_index(values, lambda block: block < 1.0) == 5
+    assert _first_index(values, lambda block: block < 1.0, start=7) == 8
+    assert _first_index(values, lambda block: block < 0.0) == -1
+
+    sync_index, gravity = _scan_and_normalize(values, 1.0, -0.5)
+    assert sync_index == 5
+    np.testing.assert_array_equal(gravity, -values / 2.0)
+
+
+def test_find_sync_index_uses_absolute_value(monkeypatch):
+    from core.data_processor import find_sync_index
+
+    monkeypatch.setattr("core.data_processor._SCAN_BLOCK", 2)
+
+    assert find_sync_index([-9.8, -9.7, 9.6, -0.3, 0.1], 0.5) == 3
+    assert find_sync_index(pd.Series([9.8, 9.8]), 0.5) == -1
+
+
+def test_filter_data_returns_empty_series_for_disabled_stream(sample_config):
+    time = pd.Series([-0.1, 0.0, 0.1, 0.2, 0.3])
+    gravity = pd.Series([0.0, 0.0, 0.0, 0.0, 2.0])
+
+    filtered_time, filtered_inner, filtered_drag, filtered_adjusted, _ = filter_data(
+        time, gravity, pd.Series(dtype=float), time, sample_config
+    )
+
+    assert filtered_drag.empty and filtered_drag.dtype == np.float64
+    assert filtered_adjusted.empty and filtered_adjusted is not filtered_drag
+    assert filtered_time.index[0] == 1
+    assert len(filtered_inner) == len(filtered_time)
+
+
+def test_detect_columns_matches_whole_words_only(tmp_path):
+    csv_path = tmp_path / "names.csv"
+    csv_path.write_text("Status,Time (s),Gain,ACC_X,g\n1,0.0,2,0.1,0.2\n", encoding="utf-8")
+
+    time_cols, acc_cols = detect_columns(str(csv_path))
+
+    assert time_cols == ["Time (s)"]
+    assert acc_cols == ["ACC_X", "g"]
+
+
+def test_load_and_process_data_shares_adjusted_time_when_sync_points_match(tmp_path, sample_config):
+    csv_path = tmp_path / "shared.csv"
+    pd.DataFrame({"time_s": [0.0, 0.1, 0.2], "acc_ic": [5.0, 0.1, 0.1], "acc_ds": [5.0, 0.1, 0.1]}).to_csv(
+        csv_path, index=False
+    )
+
+    adjusted_time_inner, _, _, adjusted_time_drag = load_and_process_data(str(csv_path), sample_config)
+
+    assert adjusted_time_inner.tolist() == pytest.approx([-0.1, 0.0, 0.1])
+    pd.testing.assert_series_equal(adjusted_time_drag, adjusted_time_inner)
+    assert np.shares_memory(adjusted_time_inner.to_numpy(), adjusted_time_drag.to_numpy())
+    # 共有している配列は読み取り専用にする
+    assert not adjusted_time_drag.to_numpy().flags.writeable
+
+
+def test_load_and_process_data_rejects_zero_gravity_before_reading(monkeypatch, sample_csv_file, sample_config):
+    def _fail(*args, **kwargs):
+        raise AssertionError("CSV should not be read for an invalid config")
+
+    monkeypatch.setattr("core.data_processor._parse_csv", _fail)
+
+    with pytest.raises(DataProcessingError, match="重力定数が0に設定されています"):
+        load_and_process_data(sample_csv_file, {**sample_config, "gravity_constant": 0})
+
+
+def test_load_and_process_data_keeps_gravity_in_float32_when_enabled(sample_csv_file, sample_config):
+    expected = load_and_process_data(sample_csv_file, sample_config)
+    adjusted_time_inner, gravity_inner, gravity_drag, adjusted_time_drag = load_and_process_data(
+        sample_csv_file, {**sample_config, "use_float32": True}
+    )
+
+    assert gravity_inner.dtype == np.float32
+    assert gravity_drag.dtype == np.float32
+    assert adjusted_time_inner.dtype == np.float64
+    np.testing.assert_allclose(gravity_inner, expected[1], rtol=1e-6)
+    pd.testing.assert_series_equal(adjusted_time_drag, expected[3])
+
+
+def test_detect_columns_reads_sample_only_when_names_are_inconclusive(monkeypatch, tmp_path):
+    from core import data_processor
+
+    row_limits = []
+    original_read_csv = data_processor._read_csv
+
+    def _recording_read_csv(file_path, **kwargs):
+        row_limits.append(kwargs.get("nrows"))
+        return original_read_csv(file_path, **kwargs)
+
+    monkeypatch.setattr("core.data_processor._read_csv", _recording_read_csv)
+
+    named = tmp_path / "named.csv"
+    named.write_text("time,acc_a\n0,1\n", encoding="utf-8")
+    assert detect_columns(str(named)) == (["time"], ["acc_a"])
+    assert row_limits == [0]
+
+    row_limits.clear()
+    unnamed = tmp_path / "unnamed.csv"
+    unnamed.write_text("time,label,value\n0,x,1\n", encoding="utf-8")
+    assert detect_columns(str(unnamed)) == (["time"], ["value"])
+    assert row_limits == [0, data_processor._DETECT_SAMPLE_ROWS]
+
+
+def test_load_and_process_data_uses_given_raw_data_frame(monkeypatch, tmp_path, sample_config):
+    import core.data_processor as data_processor
+    from core.data_processor import read_raw_data
+
+    csv_path = tmp_path / "raw.csv"
+    pd.DataFrame(
+        {"note": ["a", "b", "c"], "time_s": [0.0, 0.1, 0.2], "acc_ic": [5.0, 0.1, 0.1], "acc_ds": [5.0, 0.1, 0.1]}
+    ).to_csv(csv_path, index=False)
+
+    raw_data = read_raw_data(str(csv_path))
+    assert raw_data.columns.tolist() == ["note", "time_s", "acc_ic", "acc_ds"]
+    # 読み込んだDataFrameはモジュール側に保持しない
+    assert not hasattr(data_processor, "_raw_frames")
+    expected = raw_data.copy()
+
+    def _fail(*args, **kwargs):
+        raise AssertionError("CSV should not be re-parsed")
+
+    monkeypatch.setattr("core.data_processor._read_csv", _fail)
+    adjusted_time_inner, gravity_inner, _, _ = load_and_process_data(str(csv_path), sample_config, raw_data=raw_data)
+
+    assert adjusted_time_inner.tolist() == pytest.approx([-0.1, 0.0, 0.1])
+    assert gravity_inner.iloc[0] == pytest.approx(5.0 / sample_config["gravity_constant"])
+    assert not np.shares_memory(adjusted_time_inner.to_numpy(), raw_data["time_s"].to_numpy())
+    pd.testing.assert_frame_equal(raw_data, expected)
+
+
+def test_load_and_process_data_reports_missing_columns_with_raw_data(tmp_path, sample_config):
+    csv_path = tmp_path / "raw.csv"
+    pd.DataFrame({"t": [0.0, 0.1], "acc_ic": [5.0, 0.1], "acc_ds": [5.0, 0.1]}).to_csv(csv_path, index=False)
+
+    with pytest.raises(ColumnNotFoundError) as excinfo:
+        load_and_process_data(str(csv_path), sample_config, raw_data=pd.read_csv(csv_path))
+    assert excinfo.value.missing_columns == [sample_config["time_column"]]
+
+
+def test_index_helpers_accept_numpy_arrays():
+    from core.data_processor import _find_end_indices, _find_start_indices
+
+    time = np.array([-0.2, -0.1, 0.0, 0.1, 0.2])
+    gravity = np.array([0.0, 0.0, 0.0, 0.5, 2.0])
+
+    assert _find_start_indices(time, np.array([])) == (2, 0)
+    assert _find_end_indices(gravity, None, 2, 0, 1.0) == (4, -1)
+
+
+def test_stream_bounds_chains_start_min_and_end_searches():
+    from core.data_processor import _stream_bounds
+
+    time = np.array([-0.2, -0.1, 0.0, 0.1, 0.2, 0.3, 0.4])
+    gravity = np.array([5.0, 5.0, 0.0, 5.0, 0.0, 0.0, 5.0])
+
+    assert _stream_bounds(time, gravity, 0.15, 1.0, "Inner capsule") == (2, 4, 6)
+    assert _stream_bounds(time, gravity, 0.0, 1.0, "Inner capsule") == (2, 2, 3)
+    # 負の最小秒数では開始点より前も探索対象になる
+    assert _stream_bounds(time, gravity, -0.15, 1.0, "Inner capsule") == (2, 1, 1)
@@ -1,11 +1,62 @@
+import shutil
 from pathlib import Path
 
+import numpy as np
 import pandas as pd
 import pytest
 from openpyxl import load_workbook
 
 from core.exceptions import ExportError
-from core.export import create_output_directories, export_data, export_g_quality_data
+from core.export import (
+    _interp_columns,
+    _interp_shared,
+    _next_numbered_path,
+    create_output_directories,
+    export_data,
+    export_g_quality_data,
+)
+
+
+@pytest.mark.parametrize("n_unified", [100, 5000])
+def test_interp_shared_matches_np_interp(n_unified):
+    rng = np.random.default_rng(0)
+    xp = np.sort(rng.uniform(0.0, 1.0, 200))
+    xp[50] = xp[49]  # 重複した時刻を含む
+    ys = [rng.normal(size=xp.size), rng.normal(size=xp.size)]
+    # 補間元の時刻と一致する点を含む
+    unified_time = np.sort(np.append(np.linspace(-0.1, 1.1, n_unified), xp[50]))
+
+    for result, y in zip(_interp_shared(unified_time, xp, ys), ys, strict=True):
+        np.testing.assert_allclose(result, np.interp(unified_time, xp, y))
+
+
+def test_interp_shared_passes_through_matching_grid():
+    unified_time = np.arange(0.0, 1.0 + 0.001, 0.001)
+    xp = unified_time + 1e-12
+    y = np.sin(unified_time)
+
+    (result,) = _interp_shared(unified_time, xp, [y])
+
+    np.testing.assert_array_equal(result, y)
+    (shifted,) = _interp_shared(unified_time, unified_time + 0.0005, [y])
+    np.testing.assert_allclose(shifted, np.interp(unified_time, unified_time + 0.0005, y))
+
+
+def test_interp_columns_groups_by_axis_and_keeps_order():
+    unified_time = np.linspace(0.0, 1.0, 11)
+    time = np.linspace(0.0, 1.0, 5)
+    shifted = time - 0.5
+    sources = [
+        ("a", time, time * 2.0),
+        ("b", shifted, time),
+        ("c", time.copy(), time * 3.0),
+    ]
+
+    columns = _interp_columns(unified_time, sources)
+
+    assert list(columns) == ["a", "b", "c"]
+    for name, xp, y in sources:
+        np.testing.assert_allclose(columns[name], np.interp(unified_time, xp, y))
 
 
 def test_create_output_directories_respects_csv_dir(tmp_path):
@@ -20,6 +71,16 @@ def test_create_output_directories_respects_csv_dir(tmp_path):
     assert graphs_dir.exists()
 
 
+def test_create_output_directories_recreates_deleted_results(tmp_path):
+    results_dir, _ = create_output_directories(str(tmp_path))
+    shutil.rmtree(results_dir)
+
+    results_dir, graphs_dir = create_output_directories(str(tmp_path))
+
+    assert graphs_dir.is_dir()
+    assert results_dir == tmp_path / "results_AAT"
+
+
 def test_export_data_writes_excel_with_sheets(sample_config, raw_data_frame, tmp_path, dummy_message_box):
     csv_path = tmp_path / "data.csv"
     raw_data_frame.to_csv(csv_path, index=False)
@@ -55,6 +116,80 @@ def test_export_data_writes_excel_with_sheets(sample_config, raw_data_frame, tmp
     assert "Acceleration Data" in workbook.sheetnames
 
 
+def test_export_data_streams_columns_in_sheet_order(sample_config, raw_data_frame, tmp_path):
+    csv_path = tmp_path / "data.csv"
+    raw_data_frame.to_csv(csv_path, index=False)
+
+    time_series = raw_data_frame["time_s"]
+    gl_ic = raw_data_frame["acc_ic"] / sample_config["gravity_constant"]
+    gl_ds = (raw_data_frame["acc_ds"] / sample_config["gravity_constant"]).copy()
+    gl_ds.iloc[:] = np.nan
+    gl_ds.iloc[1] = np.inf
+
+    output_path = export_data(
+        time=time_series,
+        adjusted_time=time_series,
+        gravity_level_inner_capsule=gl_ic,
+        gravity_level_drag_shield=gl_ds,
+        file_path=str(csv_path),
+        min_mean_inner_capsule=0.1,
+        min_time_inner_capsule=0.0,
+        min_std_inner_capsule=0.01,
+        min_mean_drag_shield=None,
+        min_time_drag_shield=None,
+        min_std_drag_shield=None,
+        graph_path=None,
+        filtered_time=time_series,
+        filtered_adjusted_time=time_series,
+        config=sample_config,
+        raw_data=raw_data_frame,
+    )
+
+    workbook = load_workbook(output_path)
+    assert workbook.sheetnames == ["Gravity Level Data", "Gravity Level Statistics", "Acceleration Data"]
+    sheet = workbook["Gravity Level Data"]
+    # 0.0〜0.5 秒を 10 Hz で出力するため、丸め誤差があってもちょうど 6 行になる
+    assert sheet.max_row == 1 + len(time_series)
+    assert [cell.value for cell in sheet[1]] == [
+        "Time (s)",
+        "Gravity Level (Inner Capsule) (G)",
+        "Gravity Level (Drag Shield) (G)",
+    ]
+    assert sheet.cell(row=2, column=2).value == pytest.approx(gl_ic.iloc[0])
+    assert sheet.cell(row=2, column=3).value is None
+    assert sheet.cell(row=3, column=3).value is None
+
+
+def test_export_data_converts_integer_raw_columns(sample_config, raw_data_frame, tmp_path):
+    csv_path = tmp_path / "data.csv"
+    raw_data_frame.to_csv(csv_path, index=False)
+    raw_data = raw_data_frame.assign(acc_ic=(raw_data_frame["acc_ic"] * 100).astype(np.int64))
+
+    time_series = raw_data_frame["time_s"]
+    output_path = export_data(
+        time=time_series,
+        adjusted_time=time_series,
+        gravity_level_inner_capsule=raw_data_frame["acc_ic"],
+        gravity_level_drag_shield=raw_data_frame["acc_ds"],
+        file_path=str(csv_path),
+        min_mean_inner_capsule=None,
+        min_time_inner_capsule=None,
+        min_std_inner_capsule=None,
+        min_mean_drag_shield=None,
+        min_time_drag_shield=None,
+        min_std_drag_shield=None,
+        graph_path=None,
+        filtered_time=time_series,
+        filtered_adjusted_time=time_series,
+        config=sample_config,
+        raw_data=raw_data,
+    )
+
+    sheet = load_workbook(output_path)["Acceleration Data"]
+    assert sheet.cell(row=2, column=2).value == pytest.approx(float(raw_data["acc_ic"].iloc[0]))
+    assert sheet.cell(row=4, column=2).value == pytest.approx(98.0)
+
+
 def test_export_copies_graph_to_results_dir(sample_config, raw_data_frame, tmp_path, dummy_message_box):
     csv_path = tmp_path / "data.csv"
     raw_data_frame.to_csv(csv_path, index=False)
@@ -148,6 +283,49 @@ def test_export_g_quality_data_creates_new_file(tmp_path):
     assert sheet.cell(row=2, column=3).value == 0.05  # Mean IC
 
 
+def test_export_g_quality_data_writes_missing_sensor_as_blank(tmp_path):
+    original_csv = tmp_path / "test.csv"
+    original_csv.touch()
+
+    output_path = export_g_quality_data([(0.1, 0.0, 0.05, 0.001, None, float("nan"), float("inf"))], str(original_csv))
+
+    sheet = load_workbook(output_path)["G-quality Analysis"]
+    assert [cell.value for cell in sheet[2]] == [0.1, 0, 0.05, 0.001, None, None, None]
+
+
+def test_export_g_quality_data_replaces_existing_sheet(tmp_path):
+    """Test re-exporting G-quality data replaces the sheet instead of duplicating it."""
+    original_csv = tmp_path / "test.csv"
+    original_csv.touch()
+
+    export_g_quality_data([(0.1, 0.0, 0.05, 0.001, 0.0, 0.06, 0.003)], str(original_csv))
+    output_path = export_g_quality_data(
+        [(0.2, 0.1, 0.04, 0.001, 0.1, 0.05, 0.003), (0.3, 0.2, 0.03, 0.001, 0.2, 0.04, 0.003)],
+        str(original_csv),
+    )
+
+    workbook = load_workbook(output_path)
+    assert workbook.sheetnames.count("G-quality Analysis") == 1
+    assert workbook["G-quality Analysis"].max_row == 3
+    assert workbook["G-quality Analysis"].cell(row=2, column=1).value == 0.2
+
+
+def test_export_g_quality_data_copies_graph_once(tmp_path):
+    original_csv = tmp_path / "test.csv"
+    original_csv.touch()
+    graph_path = tmp_path / "gq.png"
+    graph_path.write_bytes(b"pngdata")
+    g_quality_data = [(0.1, 0.0, 0.05, 0.001, 0.0, 0.06, 0.003)]
+
+    export_g_quality_data(g_quality_data, str(original_csv), str(graph_path))
+    copied = tmp_path / "results_AAT" / "graphs" / "test_gq.png"
+    assert copied.read_bytes() == b"pngdata"
+
+    # 既にコピー先にあるグラフを渡しても、自身への上書きを試みない
+    export_g_quality_data(g_quality_data, str(original_csv), str(copied))
+    assert copied.read_bytes() == b"pngdata"
+
+
 def test_export_g_quality_data_appends_to_existing_file(tmp_path, sample_config, raw_data_frame):
     """Test appending G-quality data to an existing Excel file."""
     # First create a file with standard export
@@ -192,11 +370,11 @@ def test_export_data_handles_write_permission_error(tmp_path, sample_config, raw
     csv_path = tmp_path / "data.csv"
     raw_data_frame.to_csv(csv_path, index=False)
 
-    # Mock pd.ExcelWriter to raise PermissionError on init
-    def mock_excel_writer(*args, **kwargs):
+    # Mock Workbook.save to raise PermissionError
+    def mock_save(*args, **kwargs):
         raise PermissionError("Permission denied")
 
-    monkeypatch.setattr("pandas.ExcelWriter", mock_excel_writer)
+    monkeypatch.setattr("openpyxl.Workbook.save", mock_save)
 
     with pytest.raises(ExportError) as exc_info:
         export_data(
@@ -265,6 +443,13 @@ def test_export_data_respects_overwrite_confirmation(tmp_path, sample_config, ra
     assert "_1.xlsx" in result_path
 
 
+def test_next_numbered_path_fills_first_gap(tmp_path):
+    for name in ("data.xlsx", "data_1.xlsx", "data_3.xlsx", "data_2.csv", "other_2.xlsx"):
+        (tmp_path / name).touch()
+
+    assert _next_numbered_path(tmp_path, "data", ".xlsx") == tmp_path / "data_2.xlsx"
+
+
 def test_export_data_handles_missing_graph_file(tmp_path, sample_config, raw_data_frame):
     """Test that export proceeds even if graph file is missing."""
     csv_path = tmp_path / "data.csv"
@@ -3,6 +3,7 @@
 from core.paths import (
     _normalize_base_dir,
     _project_root,
+    _resolve_path,
     ensure_cache_dir,
     ensure_graphs_dir,
     ensure_results_dir,
@@ -43,6 +44,36 @@ def test_resolve_base_dir_with_file_path(tmp_path):
     assert result == tmp_path
 
 
+def test_resolve_base_dir_reuses_resolved_path(tmp_path):
+    _resolve_path.cache_clear()
+
+    first = resolve_base_dir(str(tmp_path))
+    second = resolve_base_dir(tmp_path)
+
+    assert first == second == tmp_path
+    assert _resolve_path.cache_info().hits == 1
+
+
+def test_resolve_base_dir_keys_relative_paths_on_cwd(tmp_path, monkeypatch):
+    for name in ("a", "b"):
+        (tmp_path / name / "data").mkdir(parents=True)
+    _resolve_path.cache_clear()
+
+    monkeypatch.chdir(tmp_path / "a")
+    assert resolve_base_dir("data") == tmp_path / "a" / "data"
+    monkeypatch.chdir(tmp_path / "b")
+    assert resolve_base_dir("data") == tmp_path / "b" / "data"
+
+
+def test_resolve_base_dir_rechecks_file_after_caching(tmp_path):
+    target = tmp_path / "data.csv"
+    _resolve_path.cache_clear()
+
+    assert resolve_base_dir(str(target)) == target
+    target.touch()
+    assert resolve_base_dir(str(target)) == tmp_path
+
+
 def test_ensure_results_dir_creates_directory(tmp_path):
     results = ensure_results_dir(str(tmp_path))
     assert results == tmp_path / "results_AAT"
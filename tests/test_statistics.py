@@ -2,7 +2,7 @@ import numpy as np
 import pandas as pd
 import pytest
 
-from core.statistics import calculate_range_statistics, calculate_statistics
+from core.statistics import calculate_range_statistics, calculate_statistics, precompute_prefix_sums
 
 
 def test_calculate_statistics_finds_low_variance_window():
@@ -46,6 +46,45 @@ def test_calculate_statistics_keeps_first_zero_std_window_with_single_valid_valu
     assert min_std == pytest.approx(0.0)
 
 
+def test_calculate_statistics_reuses_prefix_sums_across_windows():
+    rng = np.random.default_rng(0)
+    time = pd.Series(np.arange(200) / 100.0)
+    gravity = pd.Series(rng.normal(size=200))
+    gravity.iloc[[5, 50, 51]] = np.nan
+    prefix_sums = precompute_prefix_sums(gravity)
+
+    for window_size in (0.05, 0.1, 0.5):
+        config = {"window_size": window_size, "sampling_rate": 100}
+        expected = calculate_statistics(gravity, time, config)
+        assert calculate_statistics(gravity, time, config, prefix_sums=prefix_sums) == expected
+
+
+def test_precompute_prefix_sums_matches_separate_cumsums():
+    values = np.array([0.5, np.nan, -1.5, 2.0, np.nan, -0.25])
+    valid = ~np.isnan(values)
+    safe = np.where(valid, values, 0.0)
+
+    prefix_sums = precompute_prefix_sums(pd.Series(values))
+
+    for field, expected in (
+        (prefix_sums.count, valid.astype(float)),
+        (prefix_sums.total, safe),
+        (prefix_sums.squares, safe**2),
+        (prefix_sums.absolute, np.abs(safe)),
+    ):
+        np.testing.assert_array_equal(field, np.concatenate(([0.0], np.cumsum(expected))))
+    assert len(precompute_prefix_sums(np.array([])).count) == 1
+
+
+def test_calculate_statistics_rejects_mismatched_prefix_sums():
+    time = pd.Series([0.0, 0.1, 0.2])
+    gravity = pd.Series([0.1, 0.2, 0.3])
+    config = {"window_size": 0.2, "sampling_rate": 10}
+
+    with pytest.raises(ValueError):
+        calculate_statistics(gravity, time, config, prefix_sums=precompute_prefix_sums(gravity[:2]))
+
+
 def test_calculate_range_statistics_handles_empty_array():
     stats = calculate_range_statistics(np.array([]))
 